@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#  [/] - Cross-platform code compatible with python2.7 and python3.
+'''
+_______________|  bin2music.py : binary bits to music, native synthesizer.
+
+    Description:  Drop-in replacement for the pipeline in bin2music:
+                       hexdump | awk tones | xxd -r -p
+                  which evaluates sin() 10,001 times per input byte and
+                  passes every sample through text. Each input byte selects
+                  one of only eight notes, so here the eight waveforms are
+                  computed ONCE, exactly as the awk program does, and the
+                  output is assembled by indexing, with no per-sample math.
+                  One input byte is 0.625 seconds of sound, so this runs
+                  far faster than realtime.
+
+                  Output is byte-identical to the old pipeline (mawk):
+                  every sample is a 32-bit big-endian integer, negative
+                  values clamped to zero, played by sox as 8-bit unsigned
+                  mono at 64 kHz. Optionally a WAV header with those
+                  parameters is prepended.
+
+          Usage:  $ bin2music.py [file=/dev/urandom] [-o out] [--wav]
+                  $ bin2music.py foo.jpg | sox -t raw -r 64k -c 1 \\
+                                           -e unsigned -b 8 - -d
+                  $ bin2music.py --wav -o foo.wav foo.jpg
+                  $ cat foo.jpg | bin2music.py -   # Pipe works also.
+
+   Dependencies:  None beyond the standard library.
+
+CHANGE LOG  For latest changes, see https://github.com/rsvp/randomsys
+2026-10-18  Read small blocks as they arrive, write each note directly.
+2026-10-18  Quit quietly on broken pipe only; report other I/O errors.
+2026-10-18  First version, converted from awk tones() in bin2music.
+'''
+
+from __future__ import absolute_import, print_function, division
+import argparse
+import errno
+import math
+import os
+import struct
+import sys
+
+MINOR = [0, 2, 3, 5, 7, 8, 10, 12]
+MAJOR = [0, 2, 4, 5, 7, 9, 11, 12]
+#  Semitones from base note, as split() into awk array a[].
+
+RATE = 64000
+#      Samples per second for playback, cf. sox -r 64k.
+
+BLOCK = 64
+#       Input bytes read at most at once. Each byte is 40,004 output bytes,
+#       i.e. 0.625 seconds of sound, so a small block bounds memory, and
+#       playback starts as soon as the first bytes arrive on a pipe.
+
+
+def notes( scale=MINOR ):
+    '''Semitones selected by byte % 8, i.e. a[$1 % 8] in awk.'''
+    #  awk arrays from split() are 1-based, so a[0] is empty (zero),
+    #  and a[8] is never selected. We keep that quirk for identical output.
+    return [0] + scale[:7]
+
+
+def waveform( semitone, volume=100, base=1382 ):
+    '''Bytes of one note: awk's for (i = 0; i < 1; i+= 0.0001) loop.'''
+    frequency = base * math.exp( (semitone / 12) * math.log(2) )
+    samples = []
+    i = 0.0
+    while i < 1:
+        amplitude = int( volume * math.sin(frequency * i) )
+        #  printf("%08X") in mawk truncates, and clamps negatives to zero.
+        samples.append( max(0, amplitude) )
+        i += 0.0001
+        #  ^accumulated exactly as awk does, giving 10,001 samples.
+    return struct.pack( '>%dI' % len(samples), *samples )
+
+
+def wavetable( scale=MINOR ):
+    '''List of output bytes for each value of byte % 8.'''
+    cache = {}
+    for semitone in notes( scale ):
+        if semitone not in cache:
+            cache[semitone] = waveform( semitone )
+    return [ cache[semitone] for semitone in notes(scale) ]
+
+
+def synthesize( block, table ):
+    '''Sound bytes for a block of input bytes.'''
+    return b''.join( [ table[byte % 8] for byte in bytearray(block) ] )
+
+
+def wav_header( nbytes=0xFFFFFFFF - 36 ):
+    '''RIFF header for 8-bit unsigned mono PCM at RATE.
+    Default size means unknown length, suitable for streaming.
+    '''
+    return ( b'RIFF' + struct.pack('<I', min(nbytes + 36, 0xFFFFFFFF))
+             + b'WAVE' + b'fmt '
+             + struct.pack('<IHHIIHH', 16, 1, 1, RATE, RATE, 1, 8)
+             + b'data' + struct.pack('<I', min(nbytes, 0xFFFFFFFF)) )
+
+
+def binary_stream( name, mode ):
+    '''Open binary file, where '-' means stdin or stdout.'''
+    if name == '-':
+        std = sys.stdin if 'r' in mode else sys.stdout
+        return getattr( std, 'buffer', std )
+    return open( name, mode )
+
+
+def play( infile='/dev/urandom', outfile='-', wav=False, scale=MINOR ):
+    '''Stream music for bytes of infile to outfile.'''
+    table = wavetable( scale )
+    source = binary_stream( infile, 'rb' )
+    sink = binary_stream( outfile, 'wb' )
+    nbytes = 0
+    try:
+        if wav:
+            sink.write( wav_header() )
+        fd = source.fileno()
+        while True:
+            block = os.read( fd, BLOCK )
+            #       ^returns whatever a pipe has, without waiting for BLOCK.
+            if not block:
+                break
+            for byte in bytearray( block ):
+                sink.write( table[byte % 8] )
+                #  ^each note written as is, never joined into one object.
+            sink.flush()
+            nbytes += len( block ) * len( table[0] )
+        if wav and outfile != '-':
+            sink.seek( 0 )
+            sink.write( wav_header(nbytes) )
+        sink.flush()
+    finally:
+        if infile != '-':
+            source.close()
+        if outfile != '-':
+            sink.close()
+
+
+def main( argv=None ):
+    parser = argparse.ArgumentParser( description='Binary bits to music.' )
+    parser.add_argument( 'file', nargs='?', default='/dev/urandom',
+                         help="input file, '-' for stdin" )
+    parser.add_argument( '-o', '--output', default='-',
+                         help="output file, '-' for stdout" )
+    parser.add_argument( '--wav', action='store_true',
+                         help='prepend WAV header, else raw samples' )
+    parser.add_argument( '--major', action='store_true',
+                         help='major instead of minor scale' )
+    args = parser.parse_args( argv )
+    try:
+        play( args.file, args.output, args.wav,
+              MAJOR if args.major else MINOR )
+    except KeyboardInterrupt:
+        pass
+    except IOError as error:
+        if error.errno != errno.EPIPE:
+            sys.exit( parser.prog + ': ' + str(error) )
+        #  Broken pipe when playback quits is normal, so quietly
+        #  point stdout to devnull, lest the final flush complains.
+        devnull = os.open( os.devnull, os.O_WRONLY )
+        os.dup2( devnull, sys.stdout.fileno() )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_bin2music.py : testing of native synthesizer.
+#
+#           Usage:  Just run this unittest script to test, or run nose.
+#
+#    Dependencies:  unittest (standard Python module)
+#                   bin2music
+#                   mawk and xxd, optional for the full pipeline comparison.
+#
+'''
+- Each note must have 10,001 samples, with values as printed by the awk
+  program of the former pipeline, here hard-coded from mawk output:
+       echo 3 | mawk '{ split("0,2,3,5,7,8,10,12", a,",");
+                        for (i = 0; i < 1; i+= 0.0001)
+                        printf("%08X\\n", 100*sin(1382*exp((a[$1 % 8]/12)
+                                                  *log(2))*i)) }'
+
+- Where mawk and xxd are installed, output must be byte-identical to
+  the former pipeline for every byte % 8, minor and major.
+
+- Sound for each byte must follow as soon as it arrives on a pipe.
+
+- Missing input must fail with non-zero exit, not silently.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import os
+import struct
+import subprocess
+import sys
+import unittest
+
+import bin2music as bm
+
+
+AWK = ( '{ split("%s", a,","); for (i = 0; i < 1; i+= 0.0001) '
+        'printf("%%08X\\n", 100*sin(1382*exp((a[$1 %% 8]/12)*log(2))*i)) }' )
+
+def which( program ):
+     '''Path of program on PATH, else None.'''
+     for folder in os.environ.get( 'PATH', '' ).split( os.pathsep ):
+          path = os.path.join( folder, program )
+          if os.access( path, os.X_OK ):
+               return path
+     return None
+
+
+class Synth( unittest.TestCase ):
+
+     def samples( self, byte, scale=bm.MINOR ):
+          data = bm.wavetable( scale )[byte % 8]
+          return struct.unpack( '>%dI' % (len(data) // 4), data )
+
+
+     def test_bin2music_waveform( self ):
+          '''Sample count and known samples of awk formula.'''
+          #  byte 3 selects a[3] = 3 semitones, byte 7 selects a[7] = 10.
+          known = { 3: { 1: 0x10, 2: 0x20, 3: 0x2F, 392: 0x63,
+                         4019: 0x46, 9997: 0x06, 10000: 0 },
+                    7: { 1: 0x18, 2: 0x2F, 3: 0x43, 395: 0x0C,
+                         4016: 0x3F, 9989: 0x0D, 10000: 0 } }
+          zeros = { 3: 5027, 7: 5035 }
+          for byte in known:
+               samples = self.samples( byte )
+               self.assertEqual( len(samples), 10001 )
+               self.assertEqual( samples[0], 0 )
+               for k, value in known[byte].items():
+                    self.assertEqual( samples[k], value )
+               self.assertEqual( samples.count(0), zeros[byte] )
+               #  ^negative values clamped to zero, as mawk printf("%08X").
+          self.assertEqual( self.samples(0), self.samples(1) )
+          #  ^a[0] is empty in awk, i.e. base note, same as a[1].
+
+
+     @unittest.skipUnless( which('mawk') and which('xxd'),
+                           'needs mawk and xxd' )
+     def test_bin2music_pipeline( self ):
+          '''Byte-identical to former awk | xxd pipeline.'''
+          for scale in ( bm.MINOR, bm.MAJOR ):
+               program = AWK % ','.join( str(s) for s in scale )
+               lines = ''.join( '%d\n' % byte for byte in range(16) )
+               awk = subprocess.Popen( ['mawk', program],
+                                       stdin=subprocess.PIPE,
+                                       stdout=subprocess.PIPE )
+               xxd = subprocess.Popen( ['xxd', '-r', '-p'], stdin=awk.stdout,
+                                       stdout=subprocess.PIPE )
+               awk.stdout.close()
+               awk.stdin.write( lines.encode('ascii') )
+               awk.stdin.close()
+               expect = xxd.communicate()[0]
+               awk.wait()
+               self.assertEqual( bm.synthesize(bytearray(range(16)),
+                                               bm.wavetable(scale)), expect )
+
+
+     def test_bin2music_stream( self ):
+          '''Note for first byte on stdin comes before input ends.'''
+          here = os.path.dirname( os.path.abspath(__file__) )
+          child = subprocess.Popen( [sys.executable,
+                                     os.path.join(here, 'bin2music.py'), '-'],
+                                    stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE )
+          child.stdin.write( b'\x03' )
+          child.stdin.flush()
+          note = child.stdout.read( 40004 )
+          #  ^would block forever if input were read in large blocks.
+          child.stdin.write( b'\x07' )
+          child.stdin.close()
+          rest = child.stdout.read()
+          child.wait()
+          table = bm.wavetable()
+          self.assertEqual( note, table[3] )
+          self.assertEqual( rest, table[7] )
+
+
+     def test_bin2music_missing_file( self ):
+          '''Missing input file exits non-zero with a message.'''
+          here = os.path.dirname( os.path.abspath(__file__) )
+          child = subprocess.Popen( [sys.executable,
+                                     os.path.join(here, 'bin2music.py'),
+                                     '/nonexistent/file'],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE )
+          out, err = child.communicate()
+          self.assertNotEqual( child.returncode, 0 )
+          self.assertEqual( out, b'' )
+          self.assertIn( b'/nonexistent/file', err )
+
+
+if __name__ == '__main__':
+     unittest.main()
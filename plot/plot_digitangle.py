@@ -29,6 +29,9 @@ _______________|  plot_digitangle.py : Plot digits given their assigned angle.
                   ___ATTN___ Turtle may travel outside the screen boundary, 
                              esp. for long iterations. The remedy is to use 
                              large pixel values for WIDTH and HEIGHT.
+                  For long sequences, or without a display, use instead
+                  render_digitangle.py which auto-fits the whole walk
+                  and writes it directly to a PNG or SVG file.
 
    Dependencies:  turtle (Standard package for Python graphics, 
                           _tkinter module from python3-tk package)
@@ -41,6 +44,8 @@ _______________|  plot_digitangle.py : Plot digits given their assigned angle.
                   e  digits: https://apod.nasa.gov/htmltest/gifcity/e.1mil
 
 CHANGE LOG  For latest changes, see https://github.com/rsvp/randomsys
+2026-10-18  Defer import of turtle and window creation to first drawing,
+               so HEATMAP and read_digits() work without _tkinter.
 2017-10-03  Add origin_circle() marking starting point and color compass.
 2017-10-02  First version is a complete revision of:
                https://gist.github.com/cavedave/423d67a583ad10925aa6dc85ab7acab4
@@ -52,7 +57,6 @@ http://liveatthewitchtrials.blogspot.ie/2017/09/random-walks-with-number-digits.
 '''
 
 from __future__ import absolute_import, print_function, division
-import turtle
 import random
 
 WIDTH = 0.95
@@ -69,25 +73,43 @@ HEATMAP = ['gray', 'black', 'blue', 'purple', 'cyan',
 
 # _______________ SET-UP WINDOW SCREEN and TURTLE
 
-screen = turtle.Turtle()
-turtle.clearscreen()
-wn = turtle.Screen()  # Create graphics window.
-wn.setup(width=WIDTH, height=HEIGHT, startx=None, starty=None)
-#        startx and starty position the window, not the turtle.
+wn = None
+turtle = None
+#    Graphics window is only created, and turtle only imported, by
+#    setup_window() upon first drawing, so that importing this module
+#    (e.g. from render_digitangle.py) needs neither a display nor _tkinter.
 
-wn.tracer( SHOWFREQ, delay=DELAY_millisec)
-#          ^Use large number to minimize graphics computing time.
-turtle.speed(0)   # No animation, else use DELAY_millisec via tracer.
-turtle.pensize(2) # Controls line fatness.
-turtle.penup()    # Means no drawing when moving.
-turtle.goto(0, 0) # (0, 0) is center of the screen.
-turtle.pendown()  # Means drawing when moving.
-# turtle.hideturtle()
-#  =>  TURTLE will be initially oriented towards the east on x-axis.
+
+def setup_window():
+    '''Import turtle, create graphics window and place turtle at the center.'''
+    global wn, turtle
+    import turtle
+    screen = turtle.Turtle()
+    turtle.clearscreen()
+    wn = turtle.Screen()  # Create graphics window.
+    wn.setup(width=WIDTH, height=HEIGHT, startx=None, starty=None)
+    #        startx and starty position the window, not the turtle.
+
+    wn.tracer( SHOWFREQ, delay=DELAY_millisec)
+    #          ^Use large number to minimize graphics computing time.
+    turtle.speed(0)   # No animation, else use DELAY_millisec via tracer.
+    turtle.pensize(2) # Controls line fatness.
+    turtle.penup()    # Means no drawing when moving.
+    turtle.goto(0, 0) # (0, 0) is center of the screen.
+    turtle.pendown()  # Means drawing when moving.
+    # turtle.hideturtle()
+    #  =>  TURTLE will be initially oriented towards the east on x-axis.
+
+
+def window():
+    '''Set up window unless done already, before any drawing.'''
+    if turtle is None:
+        setup_window()
 
 
 def push( angle, pixels=50 ):
     '''Push turtle in directional angle for distance in pixels.'''
+    window()
     turtle.left( angle )
     turtle.forward( pixels )
     #  Regain original orientation:
@@ -126,6 +148,7 @@ def get_randigit():
 
 def origin_circle( pixels=210 ):
     '''Mark starting point and provide color compass as legend.'''
+    window()
     for digit in range(0, 10):
         angle = digit * 36
         turtle.left(angle)
@@ -157,6 +180,7 @@ def run_circle_read( filename, pixels=5 ):
 def savework():
     '''Save work as Encapsulated Postscript eps format.'''
     #  Convert to image format using e.g. Gimp.
+    window()
     ts = turtle.getscreen()
     ts.getcanvas().postscript(file="tmp_turtle_plot.eps")
     turtle.bye()
@@ -164,6 +188,7 @@ def savework():
 
 def main(case='randigit', datafile=None, save=False):
     '''Healthy case values are: 'demo', 'randigit', 'pi', or 'read'.'''
+    setup_window()
     if case == 'demo':
         #  Demo uses CONSTANT variables to SLOW work in progress.
         random.seed(42)  # For reproducibility.
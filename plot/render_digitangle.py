@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#  [/] - Cross-platform code compatible with python2.7 and python3.
+'''
+_______________|  render_digitangle.py : Headless render of digit angle walks.
+
+    Description:  Same drunkard walk as plot_digitangle.py, but instead of
+                  pushing the turtle one segment at a time, the whole walk
+                  is computed as cumulative sums of the d2circle (or d2east)
+                  step vectors, then rasterized straight to a PNG or SVG
+                  file using the HEATMAP colors and the origin_circle legend.
+
+                  No display is needed, and the image bounds are fitted
+                  automatically to the walk, so there is no need for
+                  huge WIDTH and HEIGHT. Digits are processed in chunks,
+                  thus 10^8 digits take seconds rather than hours.
+
+          Usage:  $ python render_digitangle.py
+                  or from Python:
+                       import render_digitangle as rd
+                       rd.render( rd.file_digits('pi-digits.txt'), 'pi.png' )
+
+                  ___ATTN___ PNG output carries no text, so the legend is
+                             the color compass of spokes only; SVG output
+                             also labels each spoke like origin_circle().
+
+   Dependencies:  numpy
+                  plot_digitangle (for HEATMAP only; turtle and _tkinter
+                                   are NOT imported, no window opened)
+
+CHANGE LOG  For latest changes, see https://github.com/rsvp/randomsys
+2026-10-18  Import of plot_digitangle no longer needs turtle.
+2026-10-18  Add mmap_digits() and digit_chunks() as memory-mapped reader.
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+import base64
+import mmap
+import os
+import struct
+import zlib
+import numpy as np
+
+from plot_digitangle import HEATMAP
+
+
+RGB = { 'gray':   (190, 190, 190),  'black':  (  0,   0,   0),
+        'blue':   (  0,   0, 255),  'purple': (160,  32, 240),
+        'cyan':   (  0, 255, 255),  'green':  (  0, 255,   0),
+        'yellow': (255, 255,   0),  'orange': (255, 165,   0),
+        'brown':  (165,  42,  42),  'red':    (255,   0,   0),
+        'white':  (255, 255, 255) }
+#  Tk (X11) definitions of the color names used by HEATMAP.
+
+BACKGROUND = 'white'
+
+CHUNK = 2 ** 21
+#       Number of digits processed at once; bounds memory use
+#       for arbitrarily long walks.
+
+SIZE = 1024
+#      Longest side of output image in pixels.
+
+MARGIN = 8
+#        Blank border in pixels around the fitted walk.
+
+
+def mmap_digits( filename, start=0, stop=None ):
+    '''Array of only digits within byte range [start, stop) of text file.'''
+    #  Vectorized equivalent of plot_digitangle.read_digits():
+    #  any text file with letters, spaces, punctuations, etc. will do.
+    #  Memory-mapped, so only the requested range is ever paged in.
+    with open( filename, 'rb' ) as file:
+        size = os.fstat( file.fileno() ).st_size
+        stop = size if stop is None else min( stop, size )
+        if start >= stop:
+            return np.zeros( 0, dtype=np.uint8 )
+        mm = mmap.mmap( file.fileno(), 0, access=mmap.ACCESS_READ )
+        try:
+            raw = np.frombuffer( mm, dtype=np.uint8, count=stop-start,
+                                 offset=start )
+            digits = raw[ (raw >= 48) & (raw <= 57) ] - 48
+            #        ^boolean indexing copies, so mm may be closed.
+            del raw
+        finally:
+            mm.close()
+    return digits
+
+
+def digit_chunks( filename, size=CHUNK ):
+    '''Generator yields uint8 digit arrays from consecutive byte chunks.'''
+    total = os.path.getsize( filename )
+    for start in range( 0, total, size ):
+        yield mmap_digits( filename, start, start + size )
+
+
+def file_digits( filename ):
+    '''Array of only digits from given text file, cf. read_digits().'''
+    parts = list( digit_chunks(filename) )
+    if not parts:
+        return np.zeros( 0, dtype=np.uint8 )
+    return np.concatenate( parts )
+
+
+def random_digits( iterations=10000 ):
+    '''Array of pseudo random digits, cf. get_randigit().'''
+    return np.random.randint( 0, 10, size=iterations ).astype( np.uint8 )
+
+
+def angles( mode='circle' ):
+    '''Directional angle in degrees for each digit, as d2circle or d2east.'''
+    digit = np.arange( 10 )
+    if mode == 'circle':
+        return digit * 36
+    elif mode == 'east':
+        return (digit - 5) * 15
+    else:
+        raise ValueError("Invalid mode argument: 'circle' or 'east'.")
+
+
+def step_table( mode='circle', pixels=4 ):
+    '''Step vector (dx, dy) for each digit, i.e. one push() in pixels.'''
+    radians = np.radians( angles(mode) )
+    return pixels * np.cos(radians), pixels * np.sin(radians)
+
+
+def chunks( digits, size=CHUNK ):
+    '''Generator yields consecutive slices of the digit array.'''
+    for start in range( 0, len(digits), size ):
+        yield digits[start:start+size]
+
+
+def walk( digits, mode='circle', pixels=4 ):
+    '''Generator yields (digits, x, y) per chunk where x, y are positions
+    AFTER each push, starting from (0, 0) like the turtle.
+    '''
+    dx, dy = step_table( mode, pixels )
+    x0, y0 = 0.0, 0.0
+    for part in chunks( digits ):
+        x = x0 + np.cumsum( dx[part] )
+        y = y0 + np.cumsum( dy[part] )
+        yield part, x, y
+        x0, y0 = x[-1], y[-1]
+
+
+def bounds( digits, mode='circle', pixels=4, legend=210 ):
+    '''Extent (xmin, xmax, ymin, ymax) of walk including legend circle.'''
+    xmin, xmax, ymin, ymax = -legend, legend, -legend, legend
+    for part, x, y in walk( digits, mode, pixels ):
+        xmin, xmax = min(xmin, x.min()), max(xmax, x.max())
+        ymin, ymax = min(ymin, y.min()), max(ymax, y.max())
+    return xmin, xmax, ymin, ymax
+
+
+class Canvas( object ):
+    '''Raster of digit codes: 0 is background, else 1 + digit.
+    Walk coordinates are fitted into SIZE pixels with y pointing up.
+    '''
+    def __init__( self, extent, size=SIZE, margin=MARGIN ):
+        xmin, xmax, ymin, ymax = extent
+        span = max( xmax - xmin, ymax - ymin, 1e-9 )
+        self.scale = (size - 2 * margin - 1) / span
+        self.width  = int( (xmax - xmin) * self.scale ) + 2 * margin + 1
+        self.height = int( (ymax - ymin) * self.scale ) + 2 * margin + 1
+        self.xoff = margin - xmin * self.scale
+        self.yoff = margin + ymax * self.scale
+        self.codes = np.zeros( (self.height, self.width), dtype=np.uint8 )
+
+    def pixel( self, x, y ):
+        '''Convert walk coordinates to (column, row) integer arrays.'''
+        #  Coordinates within the canvas are non-negative,
+        #  so truncation after adding 0.5 rounds to nearest pixel.
+        col = (x * self.scale + (self.xoff + 0.5)).astype( np.intp )
+        row = ((self.yoff + 0.5) - y * self.scale).astype( np.intp )
+        return col, row
+
+    def segments( self, x0, y0, x1, y1, digits ):
+        '''Draw segments (x0, y0) to (x1, y1) colored by their digits.
+        Later segments paint over earlier ones, as the turtle would.
+        '''
+        length = np.hypot( x1 - x0, y1 - y0 ).max() * self.scale
+        samples = max( 1, int(np.ceil(length)) )
+        #         ^enough points per segment to leave no gaps;
+        #          a single point when segments are under one pixel.
+        flat = self.codes.reshape( -1 )
+        step = max( 1, CHUNK // samples )
+        for lo in range( 0, len(digits), step ):
+            hi = lo + step
+            code = digits[lo:hi] + 1
+            if samples == 1:
+                col, row = self.pixel( x0[lo:hi], y0[lo:hi] )
+            else:
+                t = np.arange( samples ) / samples
+                col, row = self.pixel(
+                    (x0[lo:hi, None] + t * (x1-x0)[lo:hi, None]).ravel(),
+                    (y0[lo:hi, None] + t * (y1-y0)[lo:hi, None]).ravel() )
+                code = np.repeat( code, samples )
+            flat[ row * self.width + col ] = code
+        col, row = self.pixel( x1[-1:], y1[-1:] )
+        flat[ row * self.width + col ] = digits[-1] + 1
+
+    def rgb( self ):
+        '''Image as (height, width, 3) uint8 array using HEATMAP colors.'''
+        palette = np.array( [RGB[BACKGROUND]] + [RGB[c] for c in HEATMAP],
+                            dtype=np.uint8 )
+        return palette[ self.codes ]
+
+
+def draw_legend( canvas, legend=210 ):
+    '''Spokes of color compass as in plot_digitangle.origin_circle().'''
+    digits = np.arange( 10, dtype=np.uint8 )
+    radians = np.radians( angles('circle') )
+    zeros = np.zeros( 10 )
+    canvas.segments( zeros, zeros, legend * np.cos(radians),
+                     legend * np.sin(radians), digits )
+
+
+def draw( digits, mode='circle', pixels=4, legend=210, size=SIZE ):
+    '''Compute whole walk of digits into a fitted Canvas.'''
+    digits = np.asarray( digits, dtype=np.uint8 )
+    canvas = Canvas( bounds(digits, mode, pixels, legend), size )
+    if legend:
+        draw_legend( canvas, legend )
+    x0, y0 = np.zeros(1), np.zeros(1)
+    for part, x, y in walk( digits, mode, pixels ):
+        canvas.segments( np.concatenate((x0, x[:-1])),
+                         np.concatenate((y0, y[:-1])), x, y, part )
+        x0, y0 = x[-1:], y[-1:]
+    return canvas
+
+
+def png_bytes( rgb ):
+    '''Encode (height, width, 3) uint8 array as PNG, using only zlib.'''
+    height, width = rgb.shape[:2]
+    rows = np.zeros( (height, 1 + 3 * width), dtype=np.uint8 )
+    rows[:, 1:] = rgb.reshape( height, 3 * width )
+    #  ^Leading zero byte on each row is PNG filter type "None".
+
+    def chunk( tag, data ):
+        return ( struct.pack('>I', len(data)) + tag + data
+                 + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF) )
+
+    header = struct.pack( '>IIBBBBB', width, height, 8, 2, 0, 0, 0 )
+    return ( b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+             + chunk(b'IDAT', zlib.compress(rows.tobytes(), 6))
+             + chunk(b'IEND', b'') )
+
+
+def svg_text( canvas, legend=210 ):
+    '''SVG with walk embedded as PNG image, and legend labeled as text.'''
+    png = base64.b64encode( png_bytes(canvas.rgb()) ).decode( 'ascii' )
+    lines = [ '<svg xmlns="http://www.w3.org/2000/svg" '
+              'xmlns:xlink="http://www.w3.org/1999/xlink" '
+              'width="%d" height="%d">' % (canvas.width, canvas.height),
+              '<image width="%d" height="%d" xlink:href="data:image/png;'
+              'base64,%s"/>' % (canvas.width, canvas.height, png) ]
+    if legend:
+        for digit in range( 0, 10 ):
+            angle = digit * 36
+            col, row = canvas.pixel( legend * np.cos(np.radians([angle])),
+                                     legend * np.sin(np.radians([angle])) )
+            lines.append( '<text x="%d" y="%d" font-size="12">%s</text>'
+                          % (col[0], row[0], str(angle) + '&#176; '
+                             + HEATMAP[digit] + '=' + str(digit)) )
+    lines.append( '</svg>' )
+    return '\n'.join( lines ) + '\n'
+
+
+def render( digits, filename, mode='circle', pixels=4, legend=210,
+            size=SIZE ):
+    '''Save walk of digits to filename; SVG if it ends in .svg, else PNG.'''
+    canvas = draw( digits, mode, pixels, legend, size )
+    if filename.lower().endswith( '.svg' ):
+        with open( filename, 'w' ) as file:
+            file.write( svg_text(canvas, legend) )
+    else:
+        with open( filename, 'wb' ) as file:
+            file.write( png_bytes(canvas.rgb()) )
+    return canvas
+
+
+def main(case='pi', datafile=None, filename='tmp_digitangle.png'):
+    '''Healthy case values are: 'demo', 'randigit', 'pi', or 'read'.'''
+    if case == 'demo':
+        np.random.seed(42)  # For reproducibility.
+        render(random_digits(50), filename, pixels=42)
+    elif case == 'randigit':
+        render(random_digits(10000), filename)
+    elif case == 'pi':
+        render(file_digits('pi-digits.txt'), filename)
+    elif case == 'read':
+        render(file_digits(datafile), filename)
+    else:
+        raise ValueError("Invalid case argument: review main().")
+
+
+if __name__ == "__main__":
+    main('pi')
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#  [/] - Cross-platform code compatible with python2.7 and python3.
+'''
+_______________|  stats_digitangle.py : Statistics of the d2circle digit walk.
+
+    Description:  Streaming analytics for the drunkard walk of
+                  plot_digitangle.d2circle(), where digit d pushes the
+                  turtle one unit at angle 36*d degrees. For any text file
+                  of digits, even billions of them, we compute:
+
+                  - frequency of each digit,
+                  - final displacement from the origin,
+                  - maximum excursion from the origin (and when),
+                  - every return to the origin, hence first-return
+                    and recurrence times.
+
+                  The file is memory-mapped and split into byte chunks,
+                  so memory is constant per chunk, and chunks are spread
+                  across processes in two passes: first the digit counts
+                  of every chunk, which fix where each chunk starts;
+                  then the walk within each chunk from that start.
+
+    Exactness:    Returns to the origin cannot be detected reliably with
+                  floating point. The ten step vectors are powers of
+                  z = exp(i*pi/5), and since z^5 = -1 and
+                  z^4 = z^3 - z^2 + z - 1, every position is an INTEGER
+                  combination of 1, z, z^2, z^3. We walk on those four
+                  integer coordinates, so a return is exactly all zeros.
+
+          Usage:  $ python stats_digitangle.py [file=pi-digits.txt]
+                  or from Python:
+                       import stats_digitangle as sd
+                       result = sd.analyze( 'pi-digits.txt' )
+
+   Dependencies:  numpy
+                  render_digitangle (memory-mapped digit reader)
+
+CHANGE LOG  For latest changes, see https://github.com/rsvp/randomsys
+2026-10-18  First version.
+'''
+
+from __future__ import absolute_import, print_function, division
+import multiprocessing
+import os
+import sys
+import numpy as np
+
+from render_digitangle import mmap_digits
+
+
+CHUNKBYTES = 2 ** 20
+#            Bytes of text file per chunk. Walk within a chunk needs
+#            about 40 bytes per digit, i.e. 40 MB for this setting.
+
+LATTICE = np.array( [ [ 1,  0,  0,  0],     #  0:   0 degrees, z^0
+                      [ 0,  1,  0,  0],     #  1:  36 degrees, z^1
+                      [ 0,  0,  1,  0],     #  2:  72 degrees, z^2
+                      [ 0,  0,  0,  1],     #  3: 108 degrees, z^3
+                      [-1,  1, -1,  1],     #  4: 144 degrees, z^4
+                      [-1,  0,  0,  0],     #  5: 180 degrees, z^5 = -1
+                      [ 0, -1,  0,  0],
+                      [ 0,  0, -1,  0],
+                      [ 0,  0,  0, -1],
+                      [ 1, -1,  1, -1] ],   #  9: 324 degrees, z^9
+                    dtype=np.int64 )
+#  Step of each digit in integer coordinates over basis 1, z, z^2, z^3.
+
+BASIS = np.array( [ [np.cos(np.radians(36 * j)), np.sin(np.radians(36 * j))]
+                    for j in range(4) ] )
+#  (x, y) of basis 1, z, z^2, z^3 for converting integer coordinates.
+
+
+def counts( digits ):
+    '''Frequency of each digit 0 through 9 as int64 array.'''
+    return np.bincount( digits, minlength=10 ).astype( np.int64 )
+
+
+def chunk_walk( digits, start, offset=0 ):
+    '''Walk digits beginning at integer position start, where offset is
+    the number of steps already taken. Returns dict with the maximum
+    squared excursion, the step at which it occurs, and the steps at
+    which the walk is exactly at the origin.
+    '''
+    if len( digits ) == 0:
+        return { 'excursion2': 0.0, 'excursion_step': offset, 'returns': [] }
+    position = start + np.cumsum( LATTICE[digits], axis=0 )
+    xy = position.dot( BASIS )
+    r2 = (xy * xy).sum( axis=1 )
+    far = int( r2.argmax() )
+    home = np.flatnonzero( ~position.any(axis=1) ) + (offset + 1)
+    return { 'excursion2': float( r2[far] ),
+             'excursion_step': offset + far + 1,
+             'returns': home.tolist() }
+
+
+def _count_range( task ):
+    '''Pass 1 worker: digit counts within a byte range of file.'''
+    filename, start, stop = task
+    return counts( mmap_digits(filename, start, stop) )
+
+
+def _walk_range( task ):
+    '''Pass 2 worker: walk within a byte range of file.'''
+    filename, start, stop, position, offset = task
+    return chunk_walk( mmap_digits(filename, start, stop),
+                       np.array(position, dtype=np.int64), offset )
+
+
+def summarize( frequency, chunks ):
+    '''Combine total digit counts and per-chunk walks into one result.'''
+    position = frequency.dot( LATTICE )
+    x, y = position.dot( BASIS )
+    best = { 'excursion2': 0.0, 'excursion_step': 0 }
+    returns = []
+    for chunk in chunks:
+        if chunk['excursion2'] > best['excursion2']:
+            best = chunk
+        returns += chunk['returns']
+    recurrence = np.diff( [0] + returns ).tolist()
+    return { 'digits':         int( frequency.sum() ),
+             'frequency':      frequency.tolist(),
+             'position':       (float(x), float(y)),
+             'displacement':   float( np.hypot(x, y) ),
+             'excursion':      best['excursion2'] ** 0.5,
+             'excursion_step': best['excursion_step'],
+             'returns':        returns,
+             'first_return':   returns[0] if returns else None,
+             'recurrence':     recurrence }
+
+
+def analyze_digits( digits ):
+    '''Statistics of the walk of an in-memory sequence of digits.'''
+    digits = np.asarray( digits, dtype=np.uint8 )
+    return summarize( counts(digits),
+                      [chunk_walk(digits, np.zeros(4, dtype=np.int64))] )
+
+
+def analyze( filename, processes=None, chunkbytes=CHUNKBYTES ):
+    '''Statistics of the walk of digits in text file, in parallel.
+    processes=None uses every CPU; processes=1 avoids multiprocessing.
+    '''
+    size = os.path.getsize( filename )
+    ranges = [ (filename, start, start + chunkbytes)
+               for start in range(0, size, chunkbytes) ]
+    if processes == 1:
+        pool = None
+        mapper = map
+    else:
+        pool = multiprocessing.Pool( processes )
+        mapper = pool.map
+    try:
+        #  Pass 1: counts per chunk give start position of every chunk.
+        tally = list( mapper(_count_range, ranges) )
+        tasks = []
+        position = np.zeros( 4, dtype=np.int64 )
+        offset = 0
+        for (name, start, stop), freq in zip( ranges, tally ):
+            tasks.append( (name, start, stop, position.tolist(), offset) )
+            position = position + freq.dot( LATTICE )
+            offset += int( freq.sum() )
+        #  Pass 2: walk every chunk from its known start.
+        chunks = list( mapper(_walk_range, tasks) )
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    frequency = np.zeros( 10, dtype=np.int64 )
+    for freq in tally:
+        frequency += freq
+    return summarize( frequency, chunks )
+
+
+def main( filename='pi-digits.txt' ):
+    '''Print walk statistics of digits in text file.'''
+    result = analyze( filename )
+    print( ' ::  Digits:        ', result['digits'] )
+    print( ' ::  Frequency 0-9: ', result['frequency'] )
+    print( ' ::  Displacement:  ', round(result['displacement'], 3) )
+    print( ' ::  Max excursion: ', round(result['excursion'], 3),
+           'at step', result['excursion_step'] )
+    print( ' ::  First return:  ', result['first_return'] )
+    print( ' ::  Returns:       ', len(result['returns']) )
+
+
+if __name__ == "__main__":
+    main( *sys.argv[1:] )
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_render_digitangle.py : testing of headless render.
+#
+#           Usage:  Just run this unittest script to test, or run nose.
+#
+#    Dependencies:  unittest (standard Python module)
+#                   numpy
+#                   render_digitangle
+#
+'''
+- A short known walk must come out of the PNG encoder pixel for pixel,
+  in the HEATMAP colors, with later segments painting over earlier ones.
+
+- SVG output must label all ten spokes of the legend.
+
+- mode='east', empty digit arrays, and a machine without _tkinter
+  must all work.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import unittest
+import zlib
+import numpy as np
+import render_digitangle as rd
+from plot_digitangle import HEATMAP
+
+
+def png_pixels( data ):
+     '''Decode PNG written by png_bytes() to (height, width, 3) array.'''
+     assert data[:8] == b'\x89PNG\r\n\x1a\n'
+     pos, chunks = 8, {}
+     while pos < len( data ):
+          length, = struct.unpack( '>I', data[pos:pos+4] )
+          tag, body = data[pos+4:pos+8], data[pos+8:pos+8+length]
+          crc, = struct.unpack( '>I', data[pos+8+length:pos+12+length] )
+          assert crc == zlib.crc32( tag + body ) & 0xFFFFFFFF
+          chunks[tag] = body
+          pos += 12 + length
+     width, height, depth, color = struct.unpack( '>IIBB',
+                                                  chunks[b'IHDR'][:10] )
+     assert (depth, color) == (8, 2)
+     rows = np.frombuffer( zlib.decompress(chunks[b'IDAT']), dtype=np.uint8 )
+     rows = rows.reshape( height, 1 + 3 * width )
+     assert not rows[:, 0].any()
+     #      ^filter type "None" on every row.
+     return rows[:, 1:].reshape( height, width, 3 )
+
+
+class Render( unittest.TestCase ):
+
+     def setUp( self ):
+          '''Temporary directory for output files.'''
+          self.tmpdir = tempfile.mkdtemp()
+
+     def tearDown( self ):
+          '''Remove output files.'''
+          for name in os.listdir( self.tmpdir ):
+               os.remove( os.path.join(self.tmpdir, name) )
+          os.rmdir( self.tmpdir )
+
+
+     def test_render_digitangle_png( self ):
+          '''Three steps east in gray, then one back west in green.'''
+          filename = os.path.join( self.tmpdir, 'walk.png' )
+          rd.render( [0, 0, 0, 5], filename, pixels=10, legend=0, size=47 )
+          #  Extent is 30 pixels wide, so scale is exactly 1 with MARGIN 8.
+          with open( filename, 'rb' ) as file:
+               rgb = png_pixels( file.read() )
+          self.assertEqual( rgb.shape, (17, 47, 3) )
+          expect = np.empty_like( rgb )
+          expect[:] = rd.RGB['white']
+          expect[8, 8:28] = rd.RGB[HEATMAP[0]]
+          expect[8, 28:39] = rd.RGB[HEATMAP[5]]
+          self.assertTrue( (rgb == expect).all() )
+
+
+     def test_render_digitangle_svg( self ):
+          '''SVG carries the embedded PNG and ten legend labels.'''
+          filename = os.path.join( self.tmpdir, 'walk.svg' )
+          np.random.seed( 42 )
+          canvas = rd.render( rd.random_digits(500), filename )
+          with open( filename ) as file:
+               svg = file.read()
+          self.assertEqual( svg.count('<text '), 10 )
+          for digit in range( 10 ):
+               self.assertIn( '%d&#176; %s=%d' % (digit * 36, HEATMAP[digit],
+                                                  digit), svg )
+          self.assertIn( 'width="%d" height="%d"' % (canvas.width,
+                                                     canvas.height), svg )
+          self.assertEqual( max(canvas.width, canvas.height), rd.SIZE )
+
+
+     def test_render_digitangle_east_empty( self ):
+          '''East mode walks rightward; empty walk draws only the legend.'''
+          canvas = rd.draw( [5] * 100 + [0, 9], mode='east', pixels=1,
+                            legend=0 )
+          self.assertTrue( canvas.width > canvas.height )
+          self.assertEqual( set(np.unique(canvas.codes)), set([0, 1, 6, 10]) )
+          canvas = rd.draw( np.zeros(0, dtype=np.uint8) )
+          self.assertEqual( set(np.unique(canvas.codes)), set(range(11)) )
+          canvas = rd.draw( [], legend=0 )
+          self.assertFalse( canvas.codes.any() )
+          self.assertRaises( ValueError, rd.draw, [1], mode='north' )
+
+
+     def test_render_digitangle_headless( self ):
+          '''Import works where turtle and _tkinter are missing.'''
+          code = ( 'import sys\n'
+                   'sys.modules["turtle"] = None\n'
+                   'sys.modules["_tkinter"] = None\n'
+                   'import render_digitangle, stats_digitangle\n' )
+          here = os.path.dirname( os.path.abspath(__file__) )
+          self.assertEqual( subprocess.call([sys.executable, '-c', code],
+                                            cwd=here), 0 )
+
+
+if __name__ == '__main__':
+     unittest.main()
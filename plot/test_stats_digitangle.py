@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_stats_digitangle.py : testing of walk statistics.
+#
+#           Usage:  Just run this unittest script to test, or run nose.
+#
+#    Dependencies:  unittest (standard Python module)
+#                   numpy
+#                   stats_digitangle, render_digitangle
+#
+'''
+- Exact returns to the origin are checked on short hand-made walks.
+
+- Statistics of a file must not depend on how it is split into chunks,
+  nor on whether the chunks are processed in parallel.
+
+- Displacement and excursion must agree with the floating point walk
+  computed by render_digitangle.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import render_digitangle as rd
+import stats_digitangle as sd
+
+
+class Walk( unittest.TestCase ):
+
+     def setUp( self ):
+          '''Write a text file of random digits mixed with other text.'''
+          np.random.seed( 42 )
+          digits = rd.random_digits( 5000 )
+          fd, self.filename = tempfile.mkstemp( suffix='.txt' )
+          with os.fdopen( fd, 'w' ) as file:
+               file.write( 'Header 3.\n' )
+               for i in range( 0, len(digits), 50 ):
+                    file.write( ''.join(str(d) for d in digits[i:i+50]) )
+                    file.write( '\n' )
+          self.digits = np.concatenate( ([3], digits) ).astype( np.uint8 )
+
+     def tearDown( self ):
+          '''Remove temporary file.'''
+          os.remove( self.filename )
+
+
+     def test_stats_digitangle_exact_returns( self ):
+          '''Opposite digits cancel exactly, as do all ten directions.'''
+          result = sd.analyze_digits( [0, 5, 3, 8, 1, 2, 9] )
+          self.assertEqual( result['returns'], [2, 4] )
+          self.assertEqual( result['first_return'], 2 )
+          self.assertEqual( result['recurrence'], [2, 2] )
+          result = sd.analyze_digits( list(range(10)) )
+          self.assertEqual( result['returns'], [10] )
+          self.assertAlmostEqual( result['displacement'], 0 )
+
+
+     def test_stats_digitangle_mmap_digits( self ):
+          '''Memory-mapped reader agrees with plot_digitangle.read_digits().'''
+          self.assertEqual( rd.file_digits(self.filename).tolist(),
+                            self.digits.tolist() )
+
+
+     def test_stats_digitangle_chunks( self ):
+          '''Same statistics regardless of chunking and parallelism.'''
+          whole = sd.analyze_digits( self.digits )
+          self.assertEqual( sd.analyze(self.filename, processes=1), whole )
+          self.assertEqual( sd.analyze(self.filename, processes=1,
+                                       chunkbytes=97), whole )
+          self.assertEqual( sd.analyze(self.filename, processes=2,
+                                       chunkbytes=1000), whole )
+          self.assertEqual( sum(whole['frequency']), len(self.digits) )
+
+
+     def test_stats_digitangle_float_walk( self ):
+          '''Displacement and excursion agree with floating point walk.'''
+          result = sd.analyze_digits( self.digits )
+          x = np.concatenate( [p[1] for p in rd.walk(self.digits, pixels=1)] )
+          y = np.concatenate( [p[2] for p in rd.walk(self.digits, pixels=1)] )
+          r = np.hypot( x, y )
+          self.assertAlmostEqual( result['displacement'], r[-1], places=6 )
+          self.assertAlmostEqual( result['excursion'], r.max(), places=6 )
+          self.assertEqual( result['excursion_step'], int(r.argmax()) + 1 )
+
+
+if __name__ == '__main__':
+     unittest.main()
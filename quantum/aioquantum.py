@@ -0,0 +1,270 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+#  [3] - Requires python3.5 or later for async and await.
+'''
+_______________|  aioquantum.py : asyncio equivalents of randquantum.
+                      Repository : https://github.com/rsvp/randomsys
+
+randquantum.getanu() makes a blocking call which, inside an asyncio program,
+freezes the event loop for up to the timeout of 2 seconds whenever a stream
+refills. This module offers AWAITABLE equivalents of the randquantum lists
+and generators. Downloads use non-blocking asyncio streams, and each ready-made
+stream refills itself in a background task, well before it runs dry.
+
+Settings such as AUTH, BOOLauthentic, NINERS, ANUURL and SOURCE are shared
+with randquantum, as are the hybrid method and the fallback to pseudo
+simulation (with warnings emitted) if the server is inaccessible.
+
+Internal tests use unittest and a local stand-in server:  test_aioquantum.py
+
+
+CHANGE LOG  Latest version available at https://git.io/randomsys
+2026-10-18  Concurrent consumers of SipStream share one refill.
+2026-10-18  Use randquantum.SOURCE when set, via run_in_executor.
+2026-10-18  First version.
+'''
+
+import asyncio
+from urllib.parse import urlsplit
+
+import randquantum as rq
+
+
+TIMEOUT = 2
+#         Seconds to wait for server, as in randquantum.getanu().
+
+
+async def fetch( url, timeout=TIMEOUT ):
+    '''Body of HTTP(S) GET response for url, without blocking the loop.'''
+    return await asyncio.wait_for( _fetch(url), timeout )
+
+
+async def _fetch( url ):
+    parts = urlsplit( url )
+    secure = parts.scheme == 'https'
+    port = parts.port or (443 if secure else 80)
+    reader, writer = await asyncio.open_connection(
+        parts.hostname, port, ssl=secure or None )
+    try:
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        #  HTTP/1.0 so that the server simply closes after the body.
+        writer.write( ( 'GET ' + path + ' HTTP/1.0\r\n'
+                        'Host: ' + parts.netloc + '\r\n'
+                        'Connection: close\r\n\r\n' ).encode('ascii') )
+        response = await reader.read()
+    finally:
+        writer.close()
+    head, _, body = response.partition( b'\r\n\r\n' )
+    status = head.split( b'\r\n', 1 )[0].split()
+    if len( status ) < 2 or status[1] != b'200':
+        raise IOError( 'HTTP status: ' + head[:80].decode('ascii', 'replace') )
+    return body
+
+
+async def getanu( url=None ):
+    '''Awaitable randquantum.getanu(): list of uint16 from server.'''
+    return rq.anulist( await fetch(url or rq.ANUURL) )
+
+
+async def randquantum_authentic( length ):
+    '''Quantum random integers between [0, 65535] inclusive in a list.
+    Multiple calls to the server, if needed, are made concurrently.
+    If randquantum.SOURCE is set, it is asked in a worker thread.
+    '''
+    if rq.SOURCE is not None:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor( None, rq.SOURCE.fetch, length )
+    calls = int(( length / 1024.5 ) + 1 )
+    lists = await asyncio.gather( *[ getanu() for i in range(calls) ] )
+    biglist = []
+    for part in lists:
+        biglist += part
+    return biglist[:length]
+
+
+async def randquantum_safe( length, authentic=None ):
+    '''Authentic PRIMARY DEPENDENCY with offline FALLBACK.'''
+    if authentic is None:
+        authentic = rq.BOOLauthentic
+    if authentic:
+        try:
+            return await randquantum_authentic( length )
+        except Exception:
+            rq.warn(     "randquantum_authentic FAIL: now, PSEUDO simulation." )
+            return rq.randquantum_pseudo( length )
+    else:
+        rq.warn( "authentic=False for randquantum_safe implies PSEUDO simulation." )
+        return rq.randquantum_pseudo( length )
+
+
+async def randquantum( length ):
+    '''Induce INDEPENDENCE by HYBRID between authentic and pseudo.'''
+    safe = await randquantum_safe( int(rq.AUTH * length) )
+    return rq.hybrid( safe, length )
+
+
+async def boolquantum( length ):
+    '''Convert randquantum to a random list of zeros and ones.'''
+    return [ i % 2 for i in await randquantum( length ) ]
+
+
+async def realquantum( length, endpoint=1.0 ):
+    '''Convert randquantum to random real numbers: [0, endpoint]'''
+    multiplier = float( endpoint ) / 65535
+    return [ i * multiplier for i in await randquantum( length ) ]
+
+
+async def b16quantum( length, endinteger=9 ):
+    '''Random integers: [0, endinteger] where endinteger < 65536.'''
+    endpoint = endinteger + rq.NINERS
+    return [ int(r) for r in await realquantum( length, endpoint ) ]
+
+
+async def gaussquantum( length, mean=0, sdev=1.0 ):
+    '''Transform random uniform to normal Gaussian distribution,
+    see randquantum.gaussquantum() for details.
+    '''
+    gauss = []
+    while len(gauss) < length:
+        z = rq.ratio_normal( await real(), await real() )
+        if z is not None:
+            gauss.append( mean + (z * sdev))
+    return gauss[:length]
+
+
+
+# ======================================================= STREAMS ==============
+
+
+class SipStream( object ):
+    '''Async iterator equivalent of randquantum.sipstream(). Usage example:
+          import aioquantum as aq
+          sip = aq.SipStream( aq.gaussquantum, (1024, 0, 1.0) )
+          async for z in sip:
+              ...
+          #  or one at a time:
+          z = await sip.next()
+
+    The next list is downloaded in a background task as soon as the
+    current list is half consumed, so a refill rarely has to be awaited.
+    Any number of coroutines may consume one stream concurrently.
+    '''
+    def __init__( self, func_quantum, argtuple=(rq.bestlen,) ):
+        self.func_quantum = func_quantum
+        self.argtuple = argtuple
+        self.stream = []
+        self.i = 0
+        self.refill = None
+        self.loop = None
+
+    def __aiter__( self ):
+        return self
+
+    async def __anext__( self ):
+        while self.i >= len( self.stream ):
+            self._prefetch()
+            refill = self.refill
+            #  Concurrent consumers all await this ONE refill; shield it,
+            #  lest a cancelled consumer cancels it for the others.
+            try:
+                stream = await asyncio.shield( refill )
+            except Exception:
+                if self.refill is refill:
+                    self.refill = None
+                    #  ^so that the next call retries.
+                raise
+            if self.refill is refill:
+                #  First consumer to wake installs the new list,
+                #  the others find it installed and read on.
+                self.stream, self.i, self.refill = stream, 0, None
+        if self.i >= len( self.stream ) // 2:
+            self._prefetch()
+        item = self.stream[self.i]
+        self.i += 1
+        return item
+
+    async def next( self ):
+        '''Next element of stream.'''
+        return await self.__anext__()
+
+    def _prefetch( self ):
+        '''Start refill task, unless one is pending in this event loop.'''
+        loop = asyncio.get_event_loop()
+        if self.refill is None or self.loop is not loop:
+            #  A task left over from another (closed) loop is discarded.
+            self.refill = loop.create_task(
+                self.func_quantum( *self.argtuple ) )
+            self.loop = loop
+
+
+# _______________ READY-MADE STREAMS and awaitable functions:
+
+sip_boolean = SipStream( boolquantum,  (rq.bestlen,)           )
+sip_trio    = SipStream( b16quantum,   (rq.bestlen, 2)         )
+sip_nine    = SipStream( b16quantum,   (rq.bestlen, 9)         )
+sip_hundred = SipStream( b16quantum,   (rq.bestlen, 100)       )
+sip_real    = SipStream( realquantum,  (rq.bestlen, rq.NINERS) )
+sip_cent    = SipStream( realquantum,  (rq.bestlen, 100.0)     )
+sip_gauss   = SipStream( gaussquantum, (rq.bestlen, 0, 1.0)    )
+
+
+async def boolean():  return await sip_boolean.next()
+async def trio():     return await sip_trio.next() - 1
+async def nine():     return await sip_nine.next()
+async def hundred():  return await sip_hundred.next()
+async def real():     return await sip_real.next()
+async def cent():     return await sip_cent.next()
+async def gauss():    return await sip_gauss.next()
+
+
+async def seed( length=19 ):
+    '''Create a single random integer within given length.'''
+    s = ''
+    for i in range( length ):
+        s += str( await nine() )
+    return int( s )
+
+
+async def randint( endinteger ):
+    '''Random integer: [0, endinteger]; endinteger may be arbitrarily large!'''
+    ilen = len( str(endinteger) )
+    guess = await seed( ilen )
+    while guess > endinteger:
+        guess = await seed( ilen )
+    return guess
+
+
+async def randpick( listing, count=1, replace=True ):
+    '''Randomly pick element(s) from a list.'''
+    if replace==False  and  count > len(listing):
+        raise IndexError('Please adjust count <= length of listing.')
+    it = listing[:]
+    picks = []
+    for k in range( count ):
+        lucky = await randint( len(it) - 1 )
+        picks.append( it[lucky] )
+        if not replace:
+            it.remove( it[lucky] )
+    return picks
+
+
+async def shuffle( listing ):
+    '''Randomly shuffle an entire list: permutation.'''
+    return await randpick( listing, len(listing), replace=False )
+
+
+'''
+============================================================ CONCLUSION ======
+
+USAGE within a coroutine is as simple as randquantum, with await:
+
+     import aioquantum as aq
+     x = await aq.gauss()
+     n = await aq.randquantum( 4096 )
+     async for d in aq.sip_nine:
+          ...
+
+Other coroutines keep running while a download is in progress.
+'''
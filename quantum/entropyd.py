@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+#                                                     Date : 2026-10-18
+#  [/] - Cross-platform code compatible with python2.7 and python3.
+'''
+_______________|  entropyd.py : local entropy-sharing daemon for randquantum.
+                      Repository : https://github.com/rsvp/randomsys
+
+Dozens of processes on one host, each importing randquantum, would each poll
+the upstream server with their own getanu() calls. This daemon keeps ONE pool
+fed from upstream, and serves it locally with the same API, so upstream
+traffic scales with the number of hosts, not processes, and a local fetch
+takes microseconds instead of a round trip to the server.
+
+    Endpoints:  GET /API/jsonI.php?length=&type=   as the ANU API:
+                    type=uint8, uint16, or hex16 with &size= bytes per item,
+                    length between 1 and 1024 inclusive.
+                GET /bulk?bytes=N                  N raw random bytes,
+                    N at most BULKMAX and what the pool can hold.
+                GET /stats                         pool status as json.
+
+         Pool:  Kept between LOW and HIGH bytes in memory by a refill thread,
+                in blocks fetched from the upstream Source (ANU by default,
+                or a Hedge, see entropysource.py). With --spill, surplus is
+                fetched while idle into a spill file on disk (up to --spillmax
+                bytes), which is drained first when memory runs low.
+                Every byte is served at most ONCE, whether from memory or
+                disk, since the spill file is truncated as it is read.
+                A request takes nothing until the pool holds all it asks
+                for, so a large request never starves the small ones.
+
+        Usage:  $ ./entropyd.py --port 8088 --spill /var/tmp/entropyd.spill
+                then in each client process:
+                     import randquantum as rq
+                     rq.ANUURL = ( 'http://127.0.0.1:8088/API/jsonI.php'
+                                   '?length=1024&type=uint16' )
+                or equivalently getanu( url=... ) with that url.
+
+                $ ./entropyd.py --unix /tmp/entropyd.sock
+                then in each client process:
+                     rq.SOURCE = entropysource.UnixSource( '/tmp/entropyd.sock' )
+
+ Dependencies:  entropysource, randquantum (standard library otherwise)
+
+
+CHANGE LOG  Latest version available at https://git.io/randomsys
+2026-10-18  Request takes nothing until the pool holds all it asks for,
+               and BULKMAX is bounded by the pool capacity.
+2026-10-18  First version.
+'''
+
+from __future__ import print_function
+import argparse
+import binascii
+import json
+import os
+import signal
+import sys
+import threading
+import time
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler   #  Py2
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+    from urlparse import urlsplit, parse_qs
+except ImportError:
+    from http.server import HTTPServer, BaseHTTPRequestHandler      #  Py3
+    from socketserver import ThreadingMixIn, UnixStreamServer
+    from urllib.parse import urlsplit, parse_qs
+
+import entropysource as es
+import randquantum as rq
+
+
+PORT = 8088
+
+LOW  = 2 ** 16
+HIGH = 2 ** 20
+#      Bytes in memory: refill below LOW, up to HIGH.
+
+BLOCK = 1024
+#       Numbers (uint16) per upstream fetch, i.e. one API call.
+
+SPILLMAX = 2 ** 24
+#          Bytes at most in spill file on disk.
+
+MAXLENGTH = 1024
+#           Maximum length per jsonI.php request, as the ANU API.
+
+BULKMAX = HIGH
+#         Maximum bytes per bulk request, and no more than
+#         the pool can hold, see Pool.capacity().
+
+TIMEOUT = 2.0
+#         Seconds a request may wait for the pool to refill.
+
+BACKOFF = 1.0
+#         Seconds to wait after a failed upstream fetch.
+
+
+class Pool( object ):
+    '''Bytes of entropy fed from upstream source, with disk spill.'''
+
+    def __init__( self, source, low=LOW, high=HIGH, spill=None,
+                  spillmax=SPILLMAX, block=BLOCK ):
+        self.source = source
+        self.low, self.high = low, high
+        self.block = block
+        self.spillmax = spillmax
+        self.buf = bytearray()
+        self.cond = threading.Condition()
+        self.spill = None
+        if spill:
+            fd = os.open( spill, os.O_RDWR | os.O_CREAT, 0o600 )
+            self.spill = os.fdopen( fd, 'r+b' )
+        self.fetches = 0
+        self.served = 0
+        self.failures = 0
+        self.running = False
+        self.filling = True
+        self.pending = []
+        #  Bytes asked by each request waiting for the pool to refill.
+        self.thread = None
+
+    def start( self ):
+        '''Start refill thread.'''
+        self.running = True
+        self.thread = threading.Thread( target=self.refill )
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop( self ):
+        '''Stop refill thread, and spill what remains in memory.'''
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        if self.thread is not None:
+            self.thread.join()
+        if self.spill is not None:
+            with self.cond:
+                self.push_spill( bytes(self.buf) )
+                del self.buf[:]
+            self.spill.close()
+
+    def spilled( self ):
+        '''Bytes in spill file.'''
+        if self.spill is None:
+            return 0
+        return os.fstat( self.spill.fileno() ).st_size
+        #      ^no seek, so safe to call while refill thread writes.
+
+    def push_spill( self, data ):
+        '''Append data to spill file, as far as SPILLMAX permits.'''
+        room = self.spillmax - self.spilled()
+        if room > 0:
+            self.spill.seek( 0, 2 )
+            self.spill.write( data[:room] )
+            self.spill.flush()
+
+    def pop_spill( self, nbytes ):
+        '''Remove and return up to nbytes from the end of spill file.'''
+        size = self.spilled()
+        nbytes = min( nbytes, size )
+        self.spill.seek( size - nbytes )
+        data = self.spill.read( nbytes )
+        self.spill.truncate( size - nbytes )
+        return data
+
+    def upstream( self ):
+        '''One block of bytes from source.'''
+        numbers = self.source.fetch( self.block )
+        self.fetches += 1
+        return es.uint16bytes( numbers )
+
+    def refill( self ):
+        '''Refill thread: memory first, then spill file while idle.'''
+        while True:
+            with self.cond:
+                if not self.running:
+                    return
+                wanted = max( self.pending or [0] )
+                if len( self.buf ) < max( self.low, min(wanted, self.high) ):
+                    self.filling = True
+                elif len( self.buf ) >= self.high:
+                    self.filling = False
+                if self.filling and self.spilled():
+                    self.buf += self.pop_spill( self.high - len(self.buf) )
+                    self.cond.notify_all()
+                    continue
+                if not self.filling and ( self.spill is None
+                                          or self.spilled() >= self.spillmax ):
+                    self.cond.wait( 1.0 )
+                    continue
+            #  Fetch upstream without holding the lock.
+            try:
+                data = self.upstream()
+            except Exception as error:
+                self.failures += 1
+                rq.warn( 'entropyd upstream FAIL: ' + str(error) )
+                time.sleep( BACKOFF )
+                continue
+            with self.cond:
+                if len( self.buf ) < self.high:
+                    self.buf += data
+                    self.cond.notify_all()
+                else:
+                    self.push_spill( data )
+
+    def capacity( self ):
+        '''Most bytes the pool can hold, in memory and spill file.'''
+        return self.high + ( self.spillmax if self.spill is not None else 0 )
+
+    def take( self, nbytes, timeout=TIMEOUT ):
+        '''Remove and return nbytes from pool; IOError after timeout,
+        ValueError at once if nbytes exceeds capacity().
+        Nothing is taken until memory and spill hold all nbytes,
+        so a waiting request holds no bytes that others could use,
+        and a failed request costs no entropy.
+        '''
+        if nbytes > self.capacity():
+            raise ValueError( 'bytes must be at most %d, the pool capacity'
+                              % self.capacity() )
+        deadline = time.time() + timeout
+        with self.cond:
+            self.pending.append( nbytes )
+            self.cond.notify_all()
+            #  ^wake refill thread to fill up to the demand.
+            try:
+                while len( self.buf ) + self.spilled() < nbytes:
+                    remaining = deadline - time.time()
+                    if remaining <= 0 or not self.running:
+                        raise IOError( 'entropyd pool empty' )
+                    self.cond.wait( remaining )
+            finally:
+                self.pending.remove( nbytes )
+            n = min( nbytes, len(self.buf) )
+            out = bytes( self.buf[:n] )
+            del self.buf[:n]
+            if n < nbytes:
+                out += self.pop_spill( nbytes - n )
+            self.served += nbytes
+            self.cond.notify_all()
+            #  ^wake refill thread if pool fell below LOW.
+        return out
+
+    def stats( self ):
+        '''Pool status as dictionary.'''
+        with self.cond:
+            return { 'memory': len(self.buf), 'spill': self.spilled(),
+                     'fetches': self.fetches, 'served': self.served,
+                     'failures': self.failures }
+
+
+def jsonI( pool, length, kind='uint16', size=1 ):
+    '''Response of jsonI.php API as dictionary.'''
+    if kind == 'uint8':
+        data = list( bytearray(pool.take(length)) )
+    elif kind == 'uint16':
+        data = es.uint16list( pool.take(2 * length) )
+    elif kind == 'hex16':
+        raw = pool.take( length * size )
+        data = [ binascii.hexlify(raw[i:i+size]).decode('ascii')
+                 for i in range(0, len(raw), size) ]
+    else:
+        raise ValueError( 'type must be uint8, uint16 or hex16' )
+    response = { 'type': kind, 'length': length, 'data': data,
+                 'success': True }
+    if kind == 'hex16':
+        response['size'] = size
+    return response
+
+
+class Handler( BaseHTTPRequestHandler ):
+    '''HTTP requests for the pool of server.'''
+    protocol_version = 'HTTP/1.1'
+    #  Keep-alive, so a client may reuse its connection.
+
+    def do_GET( self ):
+        parts = urlsplit( self.path )
+        query = parse_qs( parts.query )
+        pool = self.server.pool
+        try:
+            if parts.path == '/API/jsonI.php':
+                length = int( query.get('length', ['1'])[0] )
+                size = int( query.get('size', ['1'])[0] )
+                if not ( 1 <= length <= MAXLENGTH and 1 <= size <= 1024 ):
+                    raise ValueError( 'length must be between 1 and 1024' )
+                kind = query.get( 'type', ['uint16'] )[0]
+                self.reply( 200, json.dumps(
+                    jsonI(pool, length, kind, size),
+                    separators=(',', ':') ).encode('ascii'),
+                    'application/json' )
+            elif parts.path == '/bulk':
+                nbytes = int( query.get('bytes', ['2048'])[0] )
+                most = min( BULKMAX, pool.capacity() )
+                if not 1 <= nbytes <= most:
+                    raise ValueError( 'bytes must be between 1 and %d'
+                                      % most )
+                self.reply( 200, pool.take(nbytes),
+                            'application/octet-stream' )
+            elif parts.path == '/stats':
+                self.reply( 200, json.dumps(pool.stats()).encode('ascii'),
+                            'application/json' )
+            else:
+                self.reply( 404, b'Not found\n', 'text/plain' )
+        except ValueError as error:
+            self.reply( 400, json.dumps({ 'success': False,
+                        'error': str(error) }).encode('ascii'),
+                        'application/json' )
+        except IOError as error:
+            self.reply( 503, json.dumps({ 'success': False,
+                        'error': str(error) }).encode('ascii'),
+                        'application/json' )
+
+    def reply( self, status, body, ctype ):
+        self.send_response( status )
+        self.send_header( 'Content-Type', ctype )
+        self.send_header( 'Content-Length', str(len(body)) )
+        self.end_headers()
+        self.wfile.write( body )
+
+    def address_string( self ):
+        #  Unix socket has no (host, port) client address.
+        return 'local'
+
+    def log_message( self, *args ):
+        pass
+
+
+class TCPServer( ThreadingMixIn, HTTPServer ):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class UnixServer( ThreadingMixIn, UnixStreamServer ):
+    daemon_threads = True
+
+    def server_bind( self ):
+        if os.path.exists( self.server_address ):
+            os.remove( self.server_address )
+        UnixStreamServer.server_bind( self )
+        #  HTTPServer would expect (host, port) here:
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+def serve( pool, port=PORT, unix=None, host='127.0.0.1' ):
+    '''Server for pool over TCP on host:port, or on Unix socket path.
+    Call serve_forever() on the result, and shutdown() to stop.
+    '''
+    if unix:
+        server = UnixServer( unix, Handler )
+    else:
+        server = TCPServer( (host, port), Handler )
+    server.pool = pool
+    return server
+
+
+def upstream_source( urls, osentropy=False ):
+    '''Single source, or Hedge across several, from command options.'''
+    sources = [ es.HTTPSource(url) for url in urls ]
+    if osentropy:
+        sources.append( es.OSSource() )
+    if not sources:
+        sources = [ es.HTTPSource(rq.ANUURL) ]
+    return sources[0] if len( sources ) == 1 else es.Hedge( sources )
+
+
+def main( argv=None ):
+    parser = argparse.ArgumentParser( description='Local entropy daemon.' )
+    parser.add_argument( '--port', type=int, default=PORT,
+                         help='TCP port on 127.0.0.1' )
+    parser.add_argument( '--unix', help='Unix socket path instead of TCP' )
+    parser.add_argument( '--upstream', action='append', default=[],
+                         help='jsonI.php url, repeat to hedge; default ANU' )
+    parser.add_argument( '--os', action='store_true',
+                         help='also hedge with OS entropy (NOT quantum)' )
+    parser.add_argument( '--spill', help='spill file path' )
+    parser.add_argument( '--spillmax', type=int, default=SPILLMAX )
+    args = parser.parse_args( argv )
+    pool = Pool( upstream_source(args.upstream, args.os),
+                 spill=args.spill, spillmax=args.spillmax )
+    pool.start()
+    server = serve( pool, args.port, args.unix )
+    signal.signal( signal.SIGTERM, lambda signum, frame: sys.exit(0) )
+    #  ^so that finally clause below also runs on kill.
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.stop()
+        if args.unix and os.path.exists( args.unix ):
+            os.remove( args.unix )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+#  [/] - Cross-platform code compatible with python2.7 and python3.
+'''
+_______________|  entropylog.py : record and replay fetched entropy.
+                      Repository : https://github.com/rsvp/randomsys
+
+True random numbers cannot be reproduced, which is the point, but then a
+simulation that went wrong cannot be re-run, and every benchmark pulls new
+data from the server. Here every block fetched by randquantum_authentic()
+can be RECORDED to a compact binary log, and later REPLAYED back at
+memory speed through that same path, offline and deterministically.
+
+Log format, two files:
+
+     path        8 byte MAGIC, then every block as uint16 little-endian,
+                 i.e. 2 bytes per number (the json text takes about 6).
+     path.idx    uint64 little-endian END offset, counted in numbers,
+                 of each block: block k spans [end[k-1], end[k]).
+                 A block of zero length marks a FAILED fetch.
+
+The index is small, 8 bytes per block, and allows seeking by block number.
+Replay raises IOError at each failure marker, so randquantum_safe() falls
+back to pseudo numbers at the same point as in the recorded run.
+
+USAGE:
+     import randquantum as rq
+     rq.SOURCE = entropylog.Recorder( 'run.log' )     # or rq.record()
+     ...  run simulation  ...
+     rq.SOURCE = entropylog.ReplaySource( 'run.log' ) # or rq.replay()
+     ...  same authentic numbers again  ...
+
+___ATTN___ randquantum() mixes in pseudo numbers, see hybrid(), so for
+           identical hybrid output also call random.seed() with the same
+           value before each run.
+
+
+CHANGE LOG  Latest version available at https://git.io/randomsys
+2026-10-18  Record failed fetches as zero-length blocks, replayed as IOError.
+2026-10-18  Recorder refuses a file without MAGIC, or a log without index.
+2026-10-18  First version.
+'''
+
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+
+from entropysource import Source, HTTPSource
+
+
+MAGIC = b'RQLOG1\n\0'
+#       First 8 bytes of every log data file.
+
+
+def tobytes( numbers ):
+    '''uint16 list to little-endian bytes.'''
+    a = array( 'H', numbers )
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tobytes() if hasattr( a, 'tobytes' ) else a.tostring()
+
+
+def fromlog( data ):
+    '''Little-endian bytes to uint16 list.'''
+    a = array( 'H' )
+    if hasattr( a, 'frombytes' ):
+        a.frombytes( data )
+    else:
+        a.fromstring( data )
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tolist()
+
+
+def read_index( path ):
+    '''List of end offsets, in numbers, of every block in log.'''
+    if not os.path.exists( path + '.idx' ):
+        return []
+    with open( path + '.idx', 'rb' ) as file:
+        raw = file.read()
+    count = len( raw ) // 8
+    return list( struct.unpack('<%dQ' % count, raw[:8 * count]) )
+
+
+class Recorder( Source ):
+    '''Wrap a source, appending every block it fetches to log at path.
+    Default source is the ANU server, like getanu().
+    IOError if path exists but is not an entropy log, or lacks its index.
+    '''
+    def __init__( self, path, source=None, weight=1.0 ):
+        Source.__init__( self, weight )
+        self.path = path
+        self.name = 'record:' + path
+        self.source = source or HTTPSource()
+        self.lock = threading.Lock()
+        size = os.path.getsize( path ) if os.path.exists( path ) else 0
+        if size:
+            with open( path, 'rb' ) as file:
+                if file.read( len(MAGIC) ) != MAGIC:
+                    raise IOError( 'Not an entropy log: ' + path )
+            if size > len( MAGIC ) and not os.path.exists( path + '.idx' ):
+                raise IOError( 'Entropy log without index: ' + path )
+        #  ^never truncate a file which is not ours, or blocks we cannot find.
+        self.ends = read_index( path )
+        while self.ends and len( MAGIC ) + 2 * self.ends[-1] > size:
+            self.ends.pop()
+        end = self.ends[-1] if self.ends else 0
+        #  Resume an existing log, dropping any block without index entry,
+        #  e.g. after a crash between writing data and index, and any
+        #  index entry without its block.
+        self.data = open( path, 'ab' )
+        if self.data.tell() == 0:
+            self.data.write( MAGIC )
+        self.data.truncate( len(MAGIC) + 2 * end )
+        self.data.seek( 0, 2 )
+        self.index = open( path + '.idx', 'ab' )
+        self.index.truncate( 8 * len(self.ends) )
+        self.index.seek( 0, 2 )
+
+    def fetch( self, length ):
+        if not length:
+            return []
+            #  ^nothing to record, and zero length would mark a failure.
+        try:
+            block = self.source.fetch( length )
+        except Exception:
+            self.append( [] )
+            raise
+        self.append( block )
+        return block
+
+    def append( self, block ):
+        '''Write block to log; empty block marks a failed fetch.'''
+        with self.lock:
+            self.data.write( tobytes(block) )
+            self.data.flush()
+            end = (self.ends[-1] if self.ends else 0) + len( block )
+            self.ends.append( end )
+            self.index.write( struct.pack('<Q', end) )
+            self.index.flush()
+
+    def close( self ):
+        self.data.close()
+        self.index.close()
+
+
+class ReplaySource( Source ):
+    '''Serve numbers of log at path back in recorded order.
+    Each fetch( length ) continues where the last one stopped, so the
+    same sequence of calls gets back exactly the recorded blocks.
+    IOError at each recorded failure, and once the log is exhausted,
+    unless loop=True.
+    '''
+    def __init__( self, path, loop=False, weight=1.0 ):
+        Source.__init__( self, weight )
+        self.path = path
+        self.name = 'replay:' + path
+        self.loop = loop
+        self.lock = threading.Lock()
+        self.ends = read_index( path )
+        self.starts = [0] + self.ends[:-1]
+        self.total = self.ends[-1] if self.ends else 0
+        self.pos = 0
+        self.k = 0
+        #  Next block number, which may be a failure marker at pos.
+        with open( path, 'rb' ) as file:
+            if file.read( len(MAGIC) ) != MAGIC:
+                raise IOError( 'Not an entropy log: ' + path )
+            self.mm = mmap.mmap( file.fileno(), 0, access=mmap.ACCESS_READ )
+
+    def __len__( self ):
+        '''Number of blocks in log.'''
+        return len( self.ends )
+
+    def numbers( self, start, stop ):
+        '''Numbers at offsets [start, stop) of log.'''
+        return fromlog( self.mm[ len(MAGIC) + 2 * start :
+                                 len(MAGIC) + 2 * stop ] )
+
+    def block( self, k ):
+        '''Recorded block number k, counted from 0.'''
+        return self.numbers( self.starts[k], self.ends[k] )
+
+    def seek( self, k ):
+        '''Continue replay from the start of block number k.'''
+        with self.lock:
+            self.pos = self.starts[k] if k < len( self.ends ) else self.total
+            self.k = min( k, len(self.ends) )
+
+    def failed( self ):
+        '''Whether next block is a failure marker at pos; skip it if so.'''
+        #  Pass blocks consumed, and markers left behind by fetches which
+        #  did not follow the recorded block boundaries.
+        while self.k < len( self.ends ) and self.ends[self.k] <= self.pos:
+            if self.starts[self.k] == self.ends[self.k] == self.pos:
+                self.k += 1
+                return True
+            self.k += 1
+        return False
+
+    def fetch( self, length ):
+        if not length:
+            return []
+        with self.lock:
+            if self.failed():
+                raise IOError( 'Entropy log recorded failure at block %d: '
+                               % (self.k - 1) + self.path )
+            if self.pos + length > self.total:
+                if not (self.loop and self.total):
+                    raise IOError( 'Entropy log exhausted: ' + self.path )
+                out = []
+                while len( out ) < length:
+                    if self.pos == self.total:
+                        self.pos, self.k = 0, 0
+                    stop = min( self.total, self.pos + length - len(out) )
+                    out += self.numbers( self.pos, stop )
+                    self.pos = stop
+                return out
+            out = self.numbers( self.pos, self.pos + length )
+            self.pos += length
+            return out
+
+    def close( self ):
+        self.mm.close()
@@ -0,0 +1,251 @@
+#  Python Module for import                           Date : 2026-10-18
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+#  [/] - Cross-platform code compatible with python2.7 and python3.
+'''
+_______________|  entropysource.py : pluggable sources for randquantum.
+                      Repository : https://github.com/rsvp/randomsys
+
+By default randquantum_authentic() downloads from the single ANU server,
+so every refill waits on the slowest response of that one server.
+This module defines a common interface for sources of random uint16,
+each with a fetch( length ) method returning a list of integers
+between [0, 65535] inclusive:
+
+     HTTPSource   any server speaking the jsonI.php API: ANU, or a local
+                  stand-in such as entropyd.py at http://127.0.0.1:port
+     OSSource     operating system entropy, os.urandom (getrandom on Linux)
+     FileSource   a file or device of random bytes, e.g. /dev/hwrng
+     UnixSource   local entropyd.py daemon listening on a Unix socket
+
+Hedge combines sources: it issues the same request to the sources in
+turn, weighted random order, each after a short HEDGE delay (or at once
+if the previous one failed), and takes the FIRST block that arrives within
+a latency budget. Tail latency of any single server is thus cut off.
+
+USAGE, to make randquantum hedge ANU against a mirror and OS entropy:
+
+     import randquantum as rq
+     import entropysource as es
+     rq.SOURCE = es.Hedge( [ es.HTTPSource( weight=3.0 ),
+                             es.HTTPSource( 'http://127.0.0.1:8088'
+                                            '/API/jsonI.php?length=1024'
+                                            '&type=uint16', weight=2.0 ),
+                             es.OSSource( weight=1.0 ) ], budget=1.0 )
+
+___ATTN___ OSSource and FileSource are NOT quantum; include them only
+           if their randomness is good enough for your purposes.
+
+
+CHANGE LOG  Latest version available at https://git.io/randomsys
+2026-10-18  Add UnixSource and uint16bytes() for entropyd.py daemon.
+2026-10-18  First version.
+'''
+
+import os
+import random
+import re
+import socket
+import struct
+import threading
+import time
+try:
+    from urllib2 import urlopen                  #  Python 2
+    from Queue import Queue, Empty
+except ImportError:
+    from urllib.request import urlopen           #  Python 3
+    from queue import Queue, Empty
+
+
+ANUURL = 'https://qrng.anu.edu.au/API/jsonI.php?length=1024&type=uint16'
+
+MAXLEN = 1024
+#        Maximum length permitted per call by the jsonI.php API.
+
+HEDGE = 0.10
+#       Seconds to wait on a source before also asking the next one.
+
+BUDGET = 2.0
+#        Seconds, in total, to wait for any source to deliver.
+
+
+def anulist( json ):
+    '''Convert json response of the API to list of integers.'''
+    if isinstance( json, bytes ):
+        json = json.decode( 'ascii' )
+    #  For length=3, json looks like:
+    #      {"type":"uint16","length":3,"data":[7731,40732,1971],"success":true}
+    #  but we ignore the json module, and use brute force:
+    json_after = json.split('[')[1]
+    strlist = json_after.split(']')[0].split(',')
+    #  Above read as string, so of course, convert to integer for our list:
+    return [ int(s) for s in strlist ]
+
+
+def uint16list( data ):
+    '''Convert bytes to list of uint16 integers, two bytes each.'''
+    return list( struct.unpack('<%dH' % (len(data) // 2), data) )
+
+
+def uint16bytes( numbers ):
+    '''Convert list of uint16 integers to bytes, two bytes each.'''
+    return struct.pack( '<%dH' % len(numbers), *numbers )
+
+
+class Source( object ):
+    '''Interface: fetch( length ) returns list of uint16 integers.
+    weight sets how often Hedge asks this source first; 0 disables it.
+    '''
+    name = 'source'
+
+    def __init__( self, weight=1.0 ):
+        self.weight = weight
+
+    def fetch( self, length ):
+        raise NotImplementedError
+
+    def close( self ):
+        pass
+
+    def __repr__( self ):
+        return '<%s %s weight=%s>' % ( type(self).__name__, self.name,
+                                       self.weight )
+
+
+class HTTPSource( Source ):
+    '''Server speaking the jsonI.php?length=&type=uint16 API.'''
+
+    def __init__( self, url=ANUURL, weight=1.0, timeout=BUDGET ):
+        Source.__init__( self, weight )
+        self.url = url
+        self.name = url
+        self.timeout = timeout
+
+    def fetch( self, length ):
+        biglist = []
+        while len( biglist ) < length:
+            n = min( MAXLEN, length - len(biglist) )
+            url = re.sub( r'length=\d+', 'length=%d' % n, self.url )
+            page = urlopen( url, timeout=self.timeout )
+            biglist += anulist( page.read() )
+        return biglist[:length]
+
+
+class OSSource( Source ):
+    '''Operating system entropy via os.urandom.'''
+    name = 'os.urandom'
+
+    def fetch( self, length ):
+        return uint16list( os.urandom(2 * length) )
+
+
+class FileSource( Source ):
+    '''File or device of random bytes, read sequentially.
+    A regular file raises IOError once exhausted.
+    '''
+    def __init__( self, path, weight=1.0 ):
+        Source.__init__( self, weight )
+        self.path = path
+        self.name = path
+        self.file = open( path, 'rb' )
+        self.lock = threading.Lock()
+
+    def fetch( self, length ):
+        with self.lock:
+            data = self.file.read( 2 * length )
+        if len( data ) < 2 * length:
+            raise IOError( 'FileSource exhausted: ' + self.path )
+        return uint16list( data )
+
+    def close( self ):
+        self.file.close()
+
+
+class UnixSource( Source ):
+    '''Local entropyd.py daemon listening on a Unix socket at path,
+    read through its bulk binary endpoint.
+    '''
+    def __init__( self, path, weight=1.0, timeout=BUDGET ):
+        Source.__init__( self, weight )
+        self.path = path
+        self.name = 'unix:' + path
+        self.timeout = timeout
+
+    def fetch( self, length ):
+        sock = socket.socket( socket.AF_UNIX, socket.SOCK_STREAM )
+        sock.settimeout( self.timeout )
+        try:
+            sock.connect( self.path )
+            sock.sendall( ( 'GET /bulk?bytes=%d HTTP/1.0\r\n\r\n'
+                            % (2 * length) ).encode('ascii') )
+            chunks = []
+            while True:
+                chunk = sock.recv( 65536 )
+                if not chunk:
+                    break
+                chunks.append( chunk )
+        finally:
+            sock.close()
+        head, _, body = b''.join( chunks ).partition( b'\r\n\r\n' )
+        status = head.split( b'\r\n', 1 )[0].split()
+        if len( status ) < 2 or status[1] != b'200':
+            raise IOError( 'UnixSource: ' + head[:80].decode('ascii', 'replace') )
+        if len( body ) != 2 * length:
+            raise IOError( 'UnixSource: short block' )
+        return uint16list( body )
+
+
+class Hedge( Source ):
+    '''Hedged requests across sources: first block within budget wins.'''
+    name = 'hedge'
+
+    def __init__( self, sources, budget=BUDGET, hedge=HEDGE, weight=1.0 ):
+        Source.__init__( self, weight )
+        self.sources = list( sources )
+        self.budget = budget
+        self.hedge = hedge
+        self.wins = {}
+        #  Number of blocks delivered by each source name, for diagnosis.
+
+    def order( self ):
+        '''Sources in random order weighted by their weight.'''
+        #  Efraimidis-Spirakis: sort by u**(1/weight), largest first.
+        keyed = [ (random.random() ** (1.0 / s.weight), i)
+                  for i, s in enumerate(self.sources) if s.weight > 0 ]
+        return [ self.sources[i] for key, i in sorted(keyed, reverse=True) ]
+
+    def fetch( self, length ):
+        results = Queue()
+
+        def worker( source ):
+            try:
+                results.put( (source, source.fetch(length), None) )
+            except Exception as error:
+                results.put( (source, None, error) )
+
+        deadline = time.time() + self.budget
+        pending = self.order()
+        running = 0
+        errors = []
+        while pending or running:
+            if pending:
+                thread = threading.Thread( target=worker,
+                                           args=(pending.pop(0),) )
+                thread.daemon = True
+                #  ^a straggler must not keep the interpreter alive.
+                thread.start()
+                running += 1
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            wait = min( self.hedge, remaining ) if pending else remaining
+            try:
+                source, data, error = results.get( timeout=wait )
+            except Empty:
+                continue
+            running -= 1
+            if error is None and len( data ) == length:
+                self.wins[source.name] = self.wins.get( source.name, 0 ) + 1
+                return data
+            errors.append( '%s: %s' % (source.name, error or 'short block') )
+        raise IOError( 'Hedge: no source delivered within budget. '
+                       + '; '.join(errors) )
@@ -1,5 +1,6 @@
 #  Python Module for import                           Date : 2015-10-10
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
+#  [/] - Cross-platform code compatible with python2.7 and python3.
 ''' 
 _______________|  randquantum.py : true random numbers using quantum mechanics. 
                       Repository : https://github.com/rsvp/randomsys
@@ -65,6 +66,9 @@ increasing speed.
 Rigorous statistical TEST RESULTS daily:  http://qrng.anu.edu.au/NIST.php
 Internal statistical tests uses unittest:  test_randquantum.py
 
+For asyncio programs, aioquantum.py offers awaitable equivalents
+which never block the event loop while downloading.
+
 
 References:
 
@@ -84,6 +88,11 @@ References:
 
 
 CHANGE LOG  Latest version available at https://git.io/randomsys
+2026-10-18  Cross-platform for python2.7 and python3.
+               Add ANUURL, anulist(), hybrid() and ratio_normal()
+               so that aioquantum.py can share them.
+2026-10-18  Add SOURCE for pluggable and hedged sources, see entropysource.py.
+2026-10-18  Add record() and replay() of fetched entropy, see entropylog.py.
 2015-10-10  Add BOOLauthentic switch for debugging convenience.
 2015-10-09  Edit comments, getanu() and randquantum() docstrings for clarity.
 2015-10-08  Induce independence by hybrid between authentic and pseudo,
@@ -105,12 +114,21 @@ CHANGE LOG  Latest version available at https://git.io/randomsys
 2015-09-29  First version. 
 '''
 
-import urllib2
+from __future__ import print_function
+try:
+    from urllib2 import urlopen                  #  Python 2
+except ImportError:
+    from urllib.request import urlopen           #  Python 3
 from math   import log
 
 from random import randrange as pseudorange 
 from sys    import stderr                    #  Used to warn of fallback.
 
+from entropysource import anulist, HTTPSource
+#    anulist() converts json response of the API to list of integers.
+import entropylog
+#      Record and replay of fetched entropy, see record() and replay().
+
 AUTH = 0.50
 #      Non-zero prob(authentic), should be reciprocal of positive integer; 
 #      see randquantum() which stochastically mixes in pseudo,
@@ -139,7 +157,14 @@ def warn( message ):
     stderr.write( ' :!  Warning #' + str(Nwarn) + ': '  + message + '\n')
 
 
-def getanu( url='https://qrng.anu.edu.au/API/jsonI.php?length=1024&type=uint16' ):
+ANUURL = 'https://qrng.anu.edu.au/API/jsonI.php?length=1024&type=uint16'
+#         Default url for getanu(); may point to a compatible local server.
+
+SOURCE = None
+#        None means getanu() from ANUURL, else any entropysource.Source,
+#        e.g. Hedge across several servers; see entropysource.py.
+
+def getanu( url=None ):
     '''Download list of Quantum Random Numbers from Australia National University.
     Note: "uint16" returns integers between 0-65535 INCLUSIVE of endpoints, 
     and maximum length permitted is 1024 (but multiple calls are permitted).
@@ -151,23 +176,19 @@ def getanu( url='https://qrng.anu.edu.au/API/jsonI.php?length=1024&type=uint16'
         Contact: cqc2t@anu.edu.au
     '''
     #  print "DEBUG: getanu() waiting for server to respond..."
-    page = urllib2.urlopen( url, timeout=2 )
+    page = urlopen( url or ANUURL, timeout=2 )
     #  print "DEBUG: server OK, retrieved json line."
     # ----------------
-    json = page.read()
-    #  For length=3, json looks like:
-    #      {"type":"uint16","length":3,"data":[7731,40732,1971],"success":true} 
-    #  but we ignore the json module, and use brute force:
-    json_after = json.split('[')[1]
-    strlist = json_after.split(']')[0].split(',')
-    #  Above read as string, so of course, convert to integer for our list:
-    return [ int(s) for s in strlist ]
+    return anulist( page.read() )
 
 
 def randquantum_authentic( length ):
     '''Quantum random integers between [0, 65535] inclusive in a list.
     The data is online thus the performance is I/O bound.
+    If SOURCE is set, it is asked instead of getanu().
     ''' 
+    if SOURCE is not None:
+        return SOURCE.fetch( length )
     #  length of 1024 will make exactly one call to server.
     #  We must possibly make multiple calls to overcome API length limitation.
     calls = int(( length / 1024.5 ) + 1 )
@@ -177,6 +198,24 @@ def randquantum_authentic( length ):
     return biglist[:length]
 
 
+def record( path ):
+    '''Append every block fetched from now on to entropy log at path,
+    and a marker for every failed fetch, replayed as the same failure.
+    '''
+    global SOURCE
+    SOURCE = entropylog.Recorder( path, SOURCE or HTTPSource(ANUURL) )
+    return SOURCE
+
+
+def replay( path, loop=False ):
+    '''Serve recorded blocks of entropy log at path, offline.
+    For identical hybrid output, also random.seed() as in the recording.
+    '''
+    global SOURCE
+    SOURCE = entropylog.ReplaySource( path, loop )
+    return SOURCE
+
+
 def randquantum_pseudo( length ): 
     '''Pseudo simulation of randquantum_authentic(), intended as fallback.
     Offline call to the standard Python package random.
@@ -215,19 +254,24 @@ def randquantum( length ):
     safe  = randquantum_safe( aulen )  
     #       ^authentic with fallback provision, which means hybrid 
     #       could be all pseudo if authentic fails entirely.
+    return hybrid( safe, length )
+
+
+def hybrid( safe, length ):
+    '''Grow hybrid list to length, mixing safe list with pseudo.'''
     authinverse = int( 1 / AUTH )
-    hybrid = []
-    i = aulen - 1
-    while len(hybrid) < length:
+    mix = []
+    i = len( safe ) - 1
+    while len(mix) < length:
         if pseudorange( 0, authinverse ):
             #              ^stochastically mixes authentic with pseudo.
-            hybrid.append( pseudorange(0, 65536) )
+            mix.append( pseudorange(0, 65536) )
         else:
             #  Pick element from tailend of safe in reverse order.
             if i >= 0:
-                hybrid.append( safe[i] )
+                mix.append( safe[i] )
                 i -= 1
-    return hybrid[:length]
+    return mix[:length]
 
 
 def boolquantum( length ):
@@ -273,12 +317,12 @@ def sipstream( func_quantum, argtuple=(bestlen,) ):
           import randquantum as rq
           sip = sipstream( rq.gaussquantum, (1024, 0, 1.0) )
           #     where the tuple serves as positional arguments.
-          print next( sip )
-          print next( sip )
-          print next( sip )
+          print( next( sip ) )
+          print( next( sip ) )
+          print( next( sip ) )
      '''
      length = argtuple[0]
-     stream = apply( func_quantum, argtuple )
+     stream = func_quantum( *argtuple )
      i = 0
      while True:
           yield stream[i]
@@ -286,7 +330,7 @@ def sipstream( func_quantum, argtuple=(bestlen,) ):
           if i == length:
                i = 0
                #   And FRESHEN the stream!
-               stream = apply( func_quantum, argtuple )
+               stream = func_quantum( *argtuple )
 
 
 # _______________ READY-MADE GENERATORS and iterating functions:
@@ -306,12 +350,12 @@ sip_real    = sipstream( realquantum,  (bestlen, NINERS ))
 sip_cent    = sipstream( realquantum,  (bestlen, 100.0)  )
 
 
-def boolean():  return sip_boolean.next()
-def trio():     return sip_trio.next() - 1
-def nine():     return sip_nine.next()
-def hundred():  return sip_hundred.next()
-def real():     return sip_real.next()
-def cent():     return sip_cent.next()
+def boolean():  return next( sip_boolean )
+def trio():     return next( sip_trio ) - 1
+def nine():     return next( sip_nine )
+def hundred():  return next( sip_hundred )
+def real():     return next( sip_real )
+def cent():     return next( sip_cent )
 
 
 
@@ -378,28 +422,36 @@ def gaussquantum( length, mean=0, sdev=1.0 ):
     Ref: https://en.wikipedia.org/wiki/Normal_distribution
     see "Generating values" section.
     '''
-    NV_MAGICCONST = 1.71552776992141
-    #             = 4*exp(-0.5)/sqrt(2.0)
     gauss = []
     while len(gauss) < length:
-        u1 = real()
-        u2 = 1 - real()
-        z = NV_MAGICCONST*(u1-0.5)/u2
-        #   z is the KEY ratio essentially between
-        #     two random reals both from uniform distribution.
-        #     It is also the multiplier to standard deviation.
-        zz = z*z/4.0
-        #  Possible rejection next...
-        if zz <= -log(u2):
+        z = ratio_normal( real(), real() )
+        if z is not None:
             gauss.append( mean + (z * sdev))
-            #  Approx. acceptance rate: 73% for <= condition.
     return gauss[:length]
 
 
+def ratio_normal( r1, r2 ):
+    '''Standard normal z from two random reals, else None if rejected.'''
+    NV_MAGICCONST = 1.71552776992141
+    #             = 4*exp(-0.5)/sqrt(2.0)
+    u1 = r1
+    u2 = 1 - r2
+    z = NV_MAGICCONST*(u1-0.5)/u2
+    #   z is the KEY ratio essentially between
+    #     two random reals both from uniform distribution.
+    #     It is also the multiplier to standard deviation.
+    zz = z*z/4.0
+    #  Possible rejection next...
+    if zz <= -log(u2):
+        #  Approx. acceptance rate: 73% for <= condition.
+        return z
+    return None
+
+
 # _______________ READY-MADE GENERATOR for standard Gaussian distribution:
 
 sip_gauss   = sipstream( gaussquantum, (bestlen, 0, 1.0) )
-def gauss():    return sip_gauss.next()
+def gauss():    return next( sip_gauss )
 
 
 #  Interesting discussion regarding generating Gaussian distribution: 
@@ -480,5 +532,8 @@ Enjoy!
 
 
 if __name__ == "__main__":
-     print "\n ::  THIS IS A MODULE for import -- not for direct execution! \n"
-     raw_input('Enter something to get out: ')
+     print( "\n ::  THIS IS A MODULE for import -- not for direct execution! \n" )
+     try:
+          raw_input( 'Enter something to get out: ' )
+     except NameError:
+          input( 'Enter something to get out: ' )
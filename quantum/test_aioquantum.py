@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_aioquantum.py : testing of asyncio module.
+#
+#           Usage:  Just run this unittest script to test, or run pytest.
+#
+#    Dependencies:  unittest (standard Python module, 3.8 or later)
+#                   aioquantum, randquantum
+#
+'''
+Tests run against a local asyncio STAND-IN server which answers like
+the jsonI.php API with pseudo random numbers, optionally after a delay,
+so no network connection is needed.
+
+- The event loop must keep running while a download is slow.
+
+- Ready-made streams must refill themselves indefinitely.
+
+- Concurrent consumers of a stream must share its downloads.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import asyncio
+import random
+import unittest
+from urllib.parse import urlsplit, parse_qs
+
+import aioquantum as aq
+import randquantum as rq
+
+
+class StandIn( object ):
+     '''Local asyncio server imitating jsonI.php?length=&type=uint16.'''
+
+     def __init__( self, delay=0 ):
+          self.delay = delay
+          self.requests = 0
+
+     async def start( self ):
+          self.server = await asyncio.start_server( self.handle,
+                                                    '127.0.0.1', 0 )
+          port = self.server.sockets[0].getsockname()[1]
+          self.url = ( 'http://127.0.0.1:%d/API/jsonI.php'
+                       '?length=1024&type=uint16' % port )
+
+     async def stop( self ):
+          self.server.close()
+          await self.server.wait_closed()
+
+     async def handle( self, reader, writer ):
+          request = await reader.readuntil( b'\r\n\r\n' )
+          self.requests += 1
+          path = request.split()[1].decode( 'ascii' )
+          length = int( parse_qs(urlsplit(path).query)['length'][0] )
+          await asyncio.sleep( self.delay )
+          data = [ random.randrange(0, 65536) for i in range(length) ]
+          body = ( '{"type":"uint16","length":%d,"data":[%s],"success":true}'
+                   % (length, ','.join(str(i) for i in data)) )
+          writer.write( b'HTTP/1.0 200 OK\r\n'
+                        b'Content-Type: application/json\r\n\r\n'
+                        + body.encode('ascii') )
+          await writer.drain()
+          writer.close()
+
+
+class AsyncQuantum( unittest.IsolatedAsyncioTestCase ):
+
+     async def asyncSetUp( self ):
+          '''Point module at stand-in server before each test.'''
+          self.standin = StandIn()
+          await self.standin.start()
+          self.anuurl = rq.ANUURL
+          rq.ANUURL = self.standin.url
+
+     async def asyncTearDown( self ):
+          '''Restore real server.'''
+          rq.ANUURL = self.anuurl
+          await self.standin.stop()
+
+
+     async def test_aioquantum_getanu( self ):
+          '''Stand-in response parses into 1024 integers in range.'''
+          data = await aq.getanu()
+          self.assertEqual( len(data), 1024 )
+          self.assertTrue( all(0 <= i <= 65535 for i in data) )
+
+
+     async def test_aioquantum_randquantum( self ):
+          '''Hybrid list of any length, with concurrent server calls.'''
+          data = await aq.randquantum( 5000 )
+          self.assertEqual( len(data), 5000 )
+          self.assertTrue( all(0 <= i <= 65535 for i in data) )
+          self.assertEqual( self.standin.requests, 3 )
+          #                 ^int( AUTH * 5000 ) needs three calls.
+
+
+     async def test_aioquantum_nonblocking( self ):
+          '''Event loop keeps ticking while a slow server responds.'''
+          self.standin.delay = 0.3
+          ticks = []
+
+          async def ticker():
+               for i in range( 20 ):
+                    ticks.append( i )
+                    await asyncio.sleep( 0.01 )
+
+          data, _ = await asyncio.gather( aq.getanu(), ticker() )
+          self.assertEqual( len(data), 1024 )
+          self.assertEqual( len(ticks), 20 )
+
+
+     async def test_aioquantum_stream_refill( self ):
+          '''Stream iterates past several lists, refilling itself.'''
+          sip = aq.SipStream( aq.b16quantum, (10, 9) )
+          digits = []
+          async for d in sip:
+               digits.append( d )
+               if len( digits ) == 35:
+                    break
+          self.assertTrue( all(0 <= d <= 9 for d in digits) )
+          self.assertGreaterEqual( self.standin.requests, 4 )
+          d = await aq.nine()
+          self.assertTrue( 0 <= d <= 9 )
+          self.assertTrue( -1 <= await aq.trio() <= 1 )
+
+
+     async def test_aioquantum_concurrent( self ):
+          '''Many concurrent nine() calls cost one refill, not one each.'''
+          await aq.b16quantum( rq.bestlen, 9 )
+          per_refill = self.standin.requests
+          self.standin.requests = 0
+          self.standin.delay = 0.05
+          #  ^all consumers arrive while the first download is pending.
+          sip_nine = aq.sip_nine
+          aq.sip_nine = aq.SipStream( aq.b16quantum, (rq.bestlen, 9) )
+          try:
+               digits = await asyncio.gather( *[aq.nine() for i in range(20)] )
+          finally:
+               aq.sip_nine = sip_nine
+          self.assertTrue( all(0 <= d <= 9 for d in digits) )
+          self.assertEqual( self.standin.requests, per_refill )
+
+
+     async def test_aioquantum_fallback( self ):
+          '''Unreachable server falls back to pseudo with a warning.'''
+          await self.standin.stop()
+          nwarn = rq.Nwarn
+          data = await aq.randquantum_safe( 100 )
+          self.assertEqual( len(data), 100 )
+          self.assertEqual( rq.Nwarn, nwarn + 1 )
+          await self.standin.start()
+
+
+     async def test_aioquantum_source( self ):
+          '''randquantum.SOURCE is asked in a worker thread when set.'''
+          import entropysource as es
+          rq.SOURCE = es.OSSource()
+          try:
+               data = await aq.randquantum_authentic( 3000 )
+          finally:
+               rq.SOURCE = None
+          self.assertEqual( len(data), 3000 )
+          self.assertEqual( self.standin.requests, 0 )
+
+
+if __name__ == '__main__':
+     unittest.main()
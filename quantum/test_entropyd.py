@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_entropyd.py : testing of local entropy daemon.
+#
+#           Usage:  Just run this unittest script to test, or run nose.
+#
+#    Dependencies:  unittest (standard Python module)
+#                   entropyd, entropysource, randquantum
+#
+'''
+The daemon is fed by OSSource instead of the server, so no
+network connection is needed.
+
+- Existing clients, i.e. getanu( url=... ), must work unchanged.
+
+- Many client requests must cost few upstream fetches.
+
+- Spilled entropy must be served, and never twice.
+
+- A large request must not starve small concurrent ones, and must
+  leave the pool intact if it times out.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+try:
+     from urllib2 import urlopen, HTTPError
+except ImportError:
+     from urllib.request import urlopen
+     from urllib.error import HTTPError
+
+import entropyd
+import entropysource as es
+import randquantum as rq
+
+
+class Daemon( unittest.TestCase ):
+
+     def setUp( self ):
+          '''Start daemon on an ephemeral TCP port.'''
+          self.tmpdir = tempfile.mkdtemp()
+          self.pool = entropyd.Pool( es.OSSource(), low=4096, high=65536,
+                                     block=8192 )
+          self.pool.start()
+          self.server = self.start( entropyd.serve(self.pool, port=0) )
+          self.base = 'http://127.0.0.1:%d' % self.server.server_address[1]
+
+     def tearDown( self ):
+          '''Stop daemon.'''
+          self.server.shutdown()
+          self.server.server_close()
+          self.pool.stop()
+          shutil.rmtree( self.tmpdir )
+
+     def start( self, server ):
+          thread = threading.Thread( target=server.serve_forever )
+          thread.daemon = True
+          thread.start()
+          return server
+
+
+     def test_entropyd_getanu( self ):
+          '''Unchanged getanu( url=... ) client, many calls, few fetches.'''
+          url = self.base + '/API/jsonI.php?length=1024&type=uint16'
+          for i in range( 50 ):
+               data = rq.getanu( url )
+               self.assertEqual( len(data), 1024 )
+               self.assertTrue( all(0 <= n <= 65535 for n in data) )
+          self.assertTrue( self.pool.fetches
+                           <= (50 * 2048 + 65536) // (2 * 8192) + 1 )
+          #  ^bounded by bytes served plus pool size, not by client calls.
+          stats = json.loads( urlopen(self.base + '/stats').read()
+                              .decode('ascii') )
+          self.assertEqual( stats['served'], 50 * 2048 )
+
+
+     def test_entropyd_types( self ):
+          '''uint8 and hex16 types, and errors as for the ANU API.'''
+          page = urlopen( self.base + '/API/jsonI.php?length=10&type=uint8' )
+          reply = json.loads( page.read().decode('ascii') )
+          self.assertEqual( len(reply['data']), 10 )
+          self.assertTrue( all(0 <= n <= 255 for n in reply['data']) )
+          page = urlopen( self.base
+                          + '/API/jsonI.php?length=5&type=hex16&size=4' )
+          reply = json.loads( page.read().decode('ascii') )
+          self.assertEqual( [len(h) for h in reply['data']], [8] * 5 )
+          self.assertRaises( HTTPError, urlopen, self.base
+                             + '/API/jsonI.php?length=1025&type=uint16' )
+
+
+     def test_entropyd_bulk_unix( self ):
+          '''Bulk binary endpoint, over TCP and over a Unix socket.'''
+          data = urlopen( self.base + '/bulk?bytes=65536' ).read()
+          self.assertEqual( len(data), 65536 )
+          #  ^all of memory pool, served as it refills.
+          self.assertRaises( HTTPError, urlopen,
+                             self.base + '/bulk?bytes=65537' )
+          #  ^more than pool can hold.
+          path = os.path.join( self.tmpdir, 'entropyd.sock' )
+          unix = self.start( entropyd.serve(self.pool, unix=path) )
+          try:
+               numbers = es.UnixSource( path ).fetch( 3000 )
+          finally:
+               unix.shutdown()
+               unix.server_close()
+          self.assertEqual( len(numbers), 3000 )
+          self.assertTrue( all(0 <= n <= 65535 for n in numbers) )
+
+
+     def test_entropyd_spill( self ):
+          '''Idle pool spills to disk, then serves spill exactly once.'''
+          spill = os.path.join( self.tmpdir, 'spill' )
+          pool = entropyd.Pool( es.OSSource(), low=2048, high=8192,
+                                spill=spill, spillmax=20480 )
+          pool.start()
+          for i in range( 100 ):
+               if pool.spilled() >= 20480:
+                    break
+               time.sleep( 0.02 )
+          self.assertEqual( pool.spilled(), 20480 )
+          fetches = pool.fetches
+          tail = open( spill, 'rb' ).read()[-2048:]
+          served = b''.join( pool.take(2048) for i in range(12) )
+          #  ^empties memory, so refill comes from the end of spill file.
+          self.assertIn( tail, served )
+          self.assertEqual( served.count(tail), 1 )
+          pool.stop()
+          self.assertTrue( os.path.getsize(spill) <= 20480 )
+          self.assertTrue( fetches <= (8192 + 20480) // 2048 + 1 )
+
+
+     def test_entropyd_concurrent( self ):
+          '''Large waiting request neither starves a small one,
+          nor costs any entropy when it times out.
+          '''
+          filename = os.path.join( self.tmpdir, 'random' )
+          with open( filename, 'wb' ) as file:
+               file.write( os.urandom(32768) )
+          source = es.FileSource( filename )
+          pool = entropyd.Pool( source, low=4096, high=65536, block=8192 )
+          pool.start()
+          for i in range( 100 ):
+               if pool.stats()['memory'] >= 32768:
+                    break
+               time.sleep( 0.02 )
+          self.assertEqual( pool.stats()['memory'], 32768 )
+          #  ^file exhausted, so no refill beyond this.
+          errors = []
+
+          def large():
+               try:
+                    pool.take( 60000, timeout=0.5 )
+               except IOError as error:
+                    errors.append( error )
+
+          thread = threading.Thread( target=large )
+          thread.start()
+          time.sleep( 0.1 )
+          small = pool.take( 100, timeout=0.1 )
+          #  ^served at once while the large request waits.
+          thread.join()
+          self.assertEqual( len(errors), 1 )
+          with open( filename, 'rb' ) as file:
+               self.assertEqual( small, file.read(100) )
+          self.assertEqual( pool.stats()['memory'], 32768 - 100 )
+          self.assertEqual( pool.stats()['served'], 100 )
+          self.assertRaises( ValueError, pool.take, 65537 )
+          #  ^beyond capacity, refused without waiting.
+          pool.stop()
+          source.close()
+
+
+if __name__ == '__main__':
+     unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_entropylog.py : testing of record and replay.
+#
+#           Usage:  Just run this unittest script to test, or run nose.
+#
+#    Dependencies:  unittest (standard Python module)
+#                   entropylog, entropysource, randquantum
+#
+'''
+OSSource stands in for the server, so no network connection is needed.
+
+- Replay must serve back exactly the recorded blocks, seek by block
+  number, and reproduce randquantum() given the same random.seed().
+
+- A failed fetch must be recorded, and replayed as a failure at the
+  same point, so the fallback to pseudo numbers happens there too.
+
+- Recording must never truncate a file which is not a log, nor a log
+  whose index is missing.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import entropylog
+import entropysource as es
+import randquantum as rq
+
+
+class FailOnce( es.OSSource ):
+     '''OSSource whose second fetch fails, like a server timeout.'''
+     def __init__( self ):
+          es.OSSource.__init__( self )
+          self.calls = 0
+
+     def fetch( self, length ):
+          self.calls += 1
+          if self.calls == 2:
+               raise IOError( 'FailOnce: simulated timeout' )
+          return es.OSSource.fetch( self, length )
+
+
+class Log( unittest.TestCase ):
+
+     def setUp( self ):
+          '''Fresh directory for log files.'''
+          self.tmpdir = tempfile.mkdtemp()
+          self.path = os.path.join( self.tmpdir, 'run.log' )
+
+     def tearDown( self ):
+          '''Restore default source and remove log files.'''
+          if rq.SOURCE is not None:
+               rq.SOURCE.close()
+          rq.SOURCE = None
+          shutil.rmtree( self.tmpdir )
+
+
+     def test_entropylog_blocks( self ):
+          '''Recorded blocks come back exactly, also by block number.'''
+          recorder = entropylog.Recorder( self.path, es.OSSource() )
+          blocks = [ recorder.fetch(n) for n in (5, 1024, 300) ]
+          recorder.close()
+          self.assertEqual( os.path.getsize(self.path),
+                            len(entropylog.MAGIC) + 2 * 1329 )
+          self.assertEqual( os.path.getsize(self.path + '.idx'), 8 * 3 )
+          replay = entropylog.ReplaySource( self.path )
+          self.assertEqual( len(replay), 3 )
+          self.assertEqual( [replay.fetch(n) for n in (5, 1024, 300)],
+                            blocks )
+          self.assertRaises( IOError, replay.fetch, 1 )
+          replay.seek( 1 )
+          self.assertEqual( replay.fetch(1024), blocks[1] )
+          self.assertEqual( replay.block(2), blocks[2] )
+          replay.close()
+
+
+     def test_entropylog_resume( self ):
+          '''Recording appends to an existing log.'''
+          recorder = entropylog.Recorder( self.path, es.OSSource() )
+          first = recorder.fetch( 10 )
+          recorder.close()
+          recorder = entropylog.Recorder( self.path, es.OSSource() )
+          second = recorder.fetch( 20 )
+          recorder.close()
+          replay = entropylog.ReplaySource( self.path )
+          self.assertEqual( replay.fetch(30), first + second )
+          replay.close()
+
+
+     def test_entropylog_failure( self ):
+          '''Failed fetch is logged and replayed as failure, in place.'''
+          recorder = entropylog.Recorder( self.path, FailOnce() )
+          first = recorder.fetch( 10 )
+          self.assertRaises( IOError, recorder.fetch, 10 )
+          third = recorder.fetch( 10 )
+          self.assertEqual( recorder.fetch(0), [] )
+          recorder.close()
+          self.assertEqual( entropylog.read_index(self.path), [10, 10, 20] )
+          replay = entropylog.ReplaySource( self.path )
+          self.assertEqual( replay.fetch(0), [] )
+          self.assertEqual( replay.fetch(10), first )
+          self.assertRaises( IOError, replay.fetch, 10 )
+          self.assertEqual( replay.fetch(10), third )
+          self.assertEqual( replay.block(1), [] )
+          replay.seek( 1 )
+          self.assertRaises( IOError, replay.fetch, 10 )
+          self.assertEqual( replay.fetch(10), third )
+          replay.close()
+
+
+     def test_entropylog_failure_randquantum( self ):
+          '''Replay falls back to pseudo at the recorded failure.'''
+          rq.SOURCE = FailOnce()
+          rq.record( self.path )
+          random.seed( 42 )
+          nwarn = rq.Nwarn
+          recorded = [ rq.randquantum(1000) for i in range(3) ]
+          self.assertEqual( rq.Nwarn, nwarn + 1 )
+          rq.SOURCE.close()
+          rq.replay( self.path )
+          random.seed( 42 )
+          self.assertEqual( [rq.randquantum(1000) for i in range(3)],
+                            recorded )
+          self.assertEqual( rq.Nwarn, nwarn + 2 )
+
+
+     def test_entropylog_not_a_log( self ):
+          '''Recorder refuses, and leaves intact, a file which is not a log.'''
+          text = b'results worth keeping\n' * 100
+          with open( self.path, 'wb' ) as file:
+               file.write( text )
+          self.assertRaises( IOError, entropylog.Recorder, self.path,
+                             es.OSSource() )
+          self.assertRaises( IOError, rq.record, self.path )
+          with open( self.path, 'rb' ) as file:
+               self.assertEqual( file.read(), text )
+          self.assertFalse( os.path.exists(self.path + '.idx') )
+
+
+     def test_entropylog_missing_index( self ):
+          '''Recorder refuses a log whose index is missing.'''
+          recorder = entropylog.Recorder( self.path, es.OSSource() )
+          recorder.fetch( 100 )
+          recorder.close()
+          os.remove( self.path + '.idx' )
+          size = os.path.getsize( self.path )
+          self.assertRaises( IOError, entropylog.Recorder, self.path,
+                             es.OSSource() )
+          self.assertEqual( os.path.getsize(self.path), size )
+          self.assertFalse( os.path.exists(self.path + '.idx') )
+
+
+     def test_entropylog_loop( self ):
+          '''Replay with loop=True wraps around instead of IOError.'''
+          recorder = entropylog.Recorder( self.path, es.OSSource() )
+          block = recorder.fetch( 4 )
+          recorder.close()
+          replay = entropylog.ReplaySource( self.path, loop=True )
+          self.assertEqual( replay.fetch(10), (block * 3)[:10] )
+          replay.close()
+
+
+     def test_entropylog_randquantum( self ):
+          '''Replay reproduces randquantum() with the same seed.'''
+          rq.SOURCE = es.OSSource()
+          rq.record( self.path )
+          random.seed( 42 )
+          recorded = rq.randquantum( 5000 )
+          rq.SOURCE.close()
+          rq.replay( self.path )
+          random.seed( 42 )
+          self.assertEqual( rq.randquantum(5000), recorded )
+          nwarn = rq.Nwarn
+          rq.randquantum( 10 )
+          self.assertEqual( rq.Nwarn, nwarn + 1 )
+          #  ^exhausted log falls back to pseudo with warning.
+
+
+if __name__ == '__main__':
+     unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per PEP 0263
+#                                                     Date : 2026-10-18
+#
+# _______________|  test_entropysource.py : testing of pluggable sources.
+#
+#           Usage:  Just run this unittest script to test, or run nose.
+#
+#    Dependencies:  unittest (standard Python module)
+#                   entropysource, randquantum
+#
+'''
+HTTPSource is tested against a local STAND-IN server in a thread, which
+answers like the jsonI.php API, so no network connection is needed.
+
+- Hedge must return the first block within budget, skipping failed
+  and slow sources, and raise IOError when no source delivers.
+
+
+CHANGE LOG
+2026-10-18  First version.
+'''
+
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+try:
+     from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+     from urlparse import urlsplit, parse_qs
+except ImportError:
+     from http.server import HTTPServer, BaseHTTPRequestHandler
+     from urllib.parse import urlsplit, parse_qs
+
+import entropysource as es
+import randquantum as rq
+
+
+class StandIn( BaseHTTPRequestHandler ):
+     '''Imitate jsonI.php?length=&type=uint16 with pseudo numbers.'''
+
+     def do_GET( self ):
+          length = int( parse_qs(urlsplit(self.path).query)['length'][0] )
+          data = [ random.randrange(0, 65536) for i in range(length) ]
+          body = ( '{"type":"uint16","length":%d,"data":[%s],"success":true}'
+                   % (length, ','.join(str(i) for i in data)) )
+          self.send_response( 200 )
+          self.end_headers()
+          self.wfile.write( body.encode('ascii') )
+
+     def log_message( self, *args ):
+          pass
+
+
+class Fixed( es.Source ):
+     '''Source answering with a constant after a delay, or failing.'''
+
+     def __init__( self, value, delay=0, fail=False, weight=1.0 ):
+          es.Source.__init__( self, weight )
+          self.value, self.delay, self.fail = value, delay, fail
+          self.name = 'fixed%d' % value
+          self.calls = 0
+
+     def fetch( self, length ):
+          self.calls += 1
+          time.sleep( self.delay )
+          if self.fail:
+               raise IOError( 'failed on purpose' )
+          return [ self.value ] * length
+
+
+class Sources( unittest.TestCase ):
+
+     def setUp( self ):
+          '''Start stand-in server in a thread.'''
+          self.server = HTTPServer( ('127.0.0.1', 0), StandIn )
+          self.thread = threading.Thread( target=self.server.serve_forever )
+          self.thread.daemon = True
+          self.thread.start()
+          self.url = ( 'http://127.0.0.1:%d/API/jsonI.php?length=1024'
+                       '&type=uint16' % self.server.server_address[1] )
+
+     def tearDown( self ):
+          '''Stop stand-in server, restore default source.'''
+          self.server.shutdown()
+          self.server.server_close()
+          rq.SOURCE = None
+
+
+     def test_entropysource_http( self ):
+          '''HTTPSource splits long requests into API sized calls.'''
+          data = es.HTTPSource( self.url ).fetch( 2500 )
+          self.assertEqual( len(data), 2500 )
+          self.assertTrue( all(0 <= i <= 65535 for i in data) )
+
+
+     def test_entropysource_os_and_file( self ):
+          '''OSSource and FileSource deliver uint16; file is exhausted.'''
+          data = es.OSSource().fetch( 1000 )
+          self.assertEqual( len(data), 1000 )
+          self.assertTrue( all(0 <= i <= 65535 for i in data) )
+          fd, filename = tempfile.mkstemp()
+          os.write( fd, b'\x01\x00\xff\xff' * 3 )
+          os.close( fd )
+          source = es.FileSource( filename )
+          self.assertEqual( source.fetch(4), [1, 65535, 1, 65535] )
+          self.assertRaises( IOError, source.fetch, 4 )
+          source.close()
+          os.remove( filename )
+
+
+     def test_entropysource_hedge( self ):
+          '''Hedge takes the first block, past failed and slow sources.'''
+          slow = Fixed( 1, delay=1.0, weight=1e6 )
+          fast = Fixed( 2 )
+          start = time.time()
+          hedge = es.Hedge( [slow, fast], budget=2.0, hedge=0.05 )
+          self.assertEqual( hedge.fetch(10), [2] * 10 )
+          self.assertTrue( time.time() - start < 0.5 )
+          self.assertEqual( hedge.wins, {'fixed2': 1} )
+          broken = Fixed( 3, fail=True, weight=1e6 )
+          hedge = es.Hedge( [broken, fast], budget=2.0, hedge=1.0 )
+          start = time.time()
+          self.assertEqual( hedge.fetch(10), [2] * 10 )
+          self.assertTrue( time.time() - start < 0.5 )
+          #  ^failure asks next source at once, without hedge delay.
+
+
+     def test_entropysource_hedge_budget( self ):
+          '''Hedge raises IOError when nothing arrives within budget.'''
+          hedge = es.Hedge( [Fixed(1, delay=1.0), Fixed(2, fail=True)],
+                            budget=0.2, hedge=0.05 )
+          start = time.time()
+          self.assertRaises( IOError, hedge.fetch, 10 )
+          self.assertTrue( time.time() - start < 0.5 )
+
+
+     def test_entropysource_weights( self ):
+          '''Heavier source is asked first more often.'''
+          heavy, light = Fixed( 1, weight=9.0 ), Fixed( 2, weight=1.0 )
+          hedge = es.Hedge( [heavy, light] )
+          first = [ hedge.order()[0] is heavy for i in range(2000) ]
+          self.assertTrue( 0.85 < sum(first) / 2000.0 < 0.95 )
+
+
+     def test_entropysource_randquantum( self ):
+          '''randquantum_authentic uses SOURCE when set.'''
+          rq.SOURCE = es.Hedge( [es.HTTPSource(self.url), Fixed(7)] )
+          data = rq.randquantum_authentic( 3000 )
+          self.assertEqual( len(data), 3000 )
+          rq.SOURCE = Fixed( 7 )
+          self.assertEqual( rq.randquantum_authentic(5), [7] * 5 )
+
+
+if __name__ == '__main__':
+     unittest.main()